@@ -31,7 +31,7 @@ class Order:
     additionalData: JSONB = NO_DEFAULT
 
 
-conn = dbm.createOrLoadConnection('login.pkl')
+conn = dbm.createOrLoadConnection('login.json')
 
 with conn:
     with conn.transaction() as tx:
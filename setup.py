@@ -1,8 +1,23 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 import pathlib
 
 from src.databasemodels import version
 
+# Compiling the modules used on every model operation is optional, they are plain Python without Cython
+try:
+    from Cython.Build import cythonize
+
+    # Named explicitly, otherwise the src package makes cythonize name them src.databasemodels.*
+    extModules = cythonize(
+        [
+            Extension(f'databasemodels.{name}', [f'src/databasemodels/{name}.py'])
+            for name in ('wrapper', 'connection', 'helper', 'representations')
+        ],
+        language_level=3
+    )
+except ImportError:
+    extModules = []
+
 here = pathlib.Path(__file__).parent.resolve()
 
 description = (here / 'README.md').read_text(encoding='utf-8')
@@ -17,9 +32,10 @@ setup(
     long_description_content_type='text/markdown',
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
+    ext_modules=extModules,
     python_requires='>=3.7, <4',
     install_requires=[
-        'psycopg',
+        'psycopg>=3.1',
         'psycopg_binary',
         'iso8601',
         'typing_extensions',
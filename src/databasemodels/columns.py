@@ -1,10 +1,12 @@
-import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import Field
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, Optional, Any, List, Sequence
 
 from psycopg import sql
 
+from .helper import cachedproperty, weakValueCache
+
 if TYPE_CHECKING:
     from psycopg import connection
 
@@ -15,10 +17,16 @@ __all__ = [
 ]
 
 
-COLUMN_NAME = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]{0,58}')
+MAX_COLUMN_NAME_LENGTH = 59
+
+
+def isValidColumnName(name: str) -> bool:
+    return 0 < len(name) <= MAX_COLUMN_NAME_LENGTH and name.isascii() and name.isidentifier()
 
 
 class Column:
+    __slots__ = ('name', 'type', '_columnDefinitionCache', '__weakref__')
+
     def __init__(self, name: str, type: 'ColumnType') -> None:
         self.name = name
         self.type = type
@@ -26,18 +34,37 @@ class Column:
     def initialize(self, conn: 'connection.Connection[Any]', recreateColumns: bool = False) -> None:
         self.type.initializeType(conn, recreateColumns)
 
-    @property
+    @cachedproperty
     def columnDefinition(self) -> 'sql.Composable':
         return sql.SQL('{} {}').format(sql.Identifier(self.name), self.type.typeStatement)
 
     @classmethod
-    def fromField(cls, field: 'Field[Any]') -> 'Column':
-        assert COLUMN_NAME.match(field.name) is not None, f'{field.name} is not a valid column name'
+    def fromField(cls, field: 'Field[Any]', type: Optional[Any] = None) -> 'Column':
+        """
+        Create a column from a dataclass field.
+
+        :param field: the field to create the column from
+        :type field: Field
+        :param type: the resolved annotation of the field, defaults to field.type
+        :type type: Optional[ColumnType]
+        :return: the column
+        :rtype: Column
+        """
+        if type is None:
+            type = field.type
+
+        assert isValidColumnName(field.name), f'{field.name} is not a valid column name'
         assert field.name != 'conn', 'Column name must not be "conn"'
 
-        assert isinstance(field.type, ColumnType), 'Fields must be annotated with a type deriving ColumnType'
+        assert isinstance(type, ColumnType), 'Fields must be annotated with a type deriving ColumnType'
 
-        return cls(field.name, field.type)
+        return cls._cachedColumn(field.name, type)
+
+    @classmethod
+    @weakValueCache
+    def _cachedColumn(cls, name: str, type: 'ColumnType') -> 'Column':
+        # Models repeating a column share one Column, and with it its cached column definition
+        return cls(sys.intern(name), type)
 
     @property
     def rawType(self) -> str:
@@ -52,6 +79,9 @@ class ColumnType(ABC):
     Defines the types of data that is allowed in a column of a model.
     """
 
+    # Weakly referenceable so subscriptions can be cached without keeping the types, or the models they refer to, alive
+    __slots__ = ('_typeStatementCache', '__weakref__')
+
     @property
     @abstractmethod
     def typeStatement(self) -> 'sql.Composable':
@@ -66,6 +96,22 @@ class ColumnType(ABC):
     def rawType(self) -> str:
         ...
 
+    @property
+    def loadedNatively(self) -> bool:
+        """
+        Whether psycopg already loads values of this type as the Python object convertDataFromString would return,
+        allowing the conversion to be skipped when reading rows.
+        """
+        return False
+
+    @property
+    def dumpedBinary(self) -> bool:
+        """
+        Whether converted values of this type can be sent to the database in psycopg's binary format, which postgres
+        reads without parsing text.
+        """
+        return False
+
     @abstractmethod
     def initializeType(self, conn: 'connection.Connection[Any]', recreate: bool) -> None:
         ...
@@ -74,7 +120,8 @@ class ColumnType(ABC):
     def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
         """
         Convert string retrieved from the database to a Python object representation.
-        Should be the inverse of convertInsertableFromData.
+        Should be the inverse of convertInsertableFromData. Types psycopg knows how to load may be passed in already
+        converted, in which case they should be returned as is.
 
         :param conn: the connection to use
         :type conn: psycopg.connection.Connection
@@ -84,6 +131,20 @@ class ColumnType(ABC):
         :rtype: Any
         """
 
+    def convertDataFromStrings(self, conn: 'connection.Connection[Any]', strings: Sequence[Optional[str]]) -> List[Any]:
+        """
+        Convert every string retrieved from the database for this column at once. Types which need to query the
+        database to convert their values should override this to do so in as few queries as possible.
+
+        :param conn: the connection to use
+        :type conn: psycopg.connection.Connection
+        :param strings: the strings to convert
+        :type strings: Sequence[Optional[str]]
+        :return: the Python objects in the same order
+        :rtype: List[Any]
+        """
+        return [self.convertDataFromString(conn, string) for string in strings]
+
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
         """
         Convert a Python object representation to something insertable by psycopg.
@@ -96,4 +157,18 @@ class ColumnType(ABC):
         :return: the insertable object
         :rtype: Any
         """
-        return data
\ No newline at end of file
+        return data
+
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        """
+        Convert every Python object being inserted into this column at once. Types which need to write to the database
+        to convert their values should override this to do so in as few queries as possible.
+
+        :param conn: the connection to use
+        :type conn: psycopg.connection.Connection
+        :param datas: the objects to convert
+        :type datas: Sequence[Any]
+        :return: the insertable objects in the same order
+        :rtype: List[Any]
+        """
+        return [self.convertInsertableFromData(conn, data) for data in datas]
\ No newline at end of file
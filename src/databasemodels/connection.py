@@ -1,11 +1,13 @@
+import json
 import pickle
 
-from typing import Union, TYPE_CHECKING, Optional, Callable, Any, cast, overload
+from typing import Union, TYPE_CHECKING, Optional, Callable, Any, Dict, Tuple, cast
 from typing_extensions import TypedDict
 from pathlib import Path, PurePath
 from psycopg import connect
+from psycopg.conninfo import make_conninfo
 
-from functools import wraps
+from functools import wraps, lru_cache
 
 if TYPE_CHECKING:
     from psycopg import connection
@@ -14,6 +16,7 @@ if TYPE_CHECKING:
 __all__ = [
     'Login',
     'connectWithLogin',
+    'closeConnection',
     'createLogin',
     'loadLogin',
     'createOrLoadLogin',
@@ -33,8 +36,26 @@ class Login(TypedDict):
 
 PathLike = Union[str, PurePath]
 
+LoginKey = Tuple[Tuple[str, Any], ...]
+
+
+# Live connections keyed by the login used to open them, reused until closed
+_connections: Dict[LoginKey, 'connection.Connection[Any]'] = {}
+
+
+def loginKey(login: Login) -> LoginKey:
+    return tuple(sorted(login.items()))
+
+
+@lru_cache(maxsize=None)
+def conninfoFromKey(key: LoginKey) -> str:
+    return make_conninfo(**dict(key))
+
 
 def processPath(pathlike: PathLike) -> 'Path':
+    # Paths are immutable so one that is already concrete can be used as is
+    if isinstance(pathlike, Path):
+        return pathlike
     return Path(pathlike)
 
 
@@ -49,8 +70,33 @@ def prompt(prompt: str, default: Optional[str] = None) -> str:
         return input(f'{prompt}: ')
 
 
-def connectWithLogin(login: Login) -> 'connection.Connection[Any]':
-    return connect(**login)
+def connectWithLogin(login: Login, prepareThreshold: Optional[int] = 5) -> 'connection.Connection[Any]':
+    """
+    Connect to the database described by login. The connection is shared: every call with the same login returns the
+    same open connection, along with its transaction state, until it is closed with closeConnection.
+    prepareThreshold is psycopg's prepare_threshold for a newly opened connection, 5 by default like psycopg's own.
+    0 prepares every query server side from its first execution, which fails for strings with several statements,
+    and None disables prepared statements. The fixed statements models execute for a single row, like insert, update
+    and delete, are prepared from their first execution whatever the threshold, unless it is None.
+    """
+    key = loginKey(login)
+
+    conn = _connections.get(key)
+
+    if conn is None or conn.closed:
+        conn = connect(conninfoFromKey(key))
+        # Only set when opening, a shared connection's settings are never changed by a later caller
+        conn.prepare_threshold = prepareThreshold
+        _connections[key] = conn
+
+    return conn
+
+
+def closeConnection(login: Login) -> None:
+    conn = _connections.pop(loginKey(login), None)
+
+    if conn is not None:
+        conn.close()
 
 
 def connectUsingLoginFunc(func: Callable[[PathLike], Login]) -> Callable[[PathLike], 'connection.Connection[Any]']:
@@ -72,8 +118,8 @@ def createLogin(filePath: PathLike) -> Login:
         port=int(prompt('Port', '5432'))
     )
 
-    with path.open('wb') as loginFile:
-        pickle.dump(login, loginFile)
+    with path.open('w') as loginFile:
+        json.dump(login, loginFile)
 
     return cast(Login, login)
 
@@ -81,17 +127,33 @@ def createLogin(filePath: PathLike) -> Login:
 def loadLogin(filePath: PathLike) -> Login:
     path = processPath(filePath)
 
-    with path.open('rb') as loginFile:
-        return cast(Login, pickle.load(loginFile))
+    data = path.read_bytes()
+
+    # Logins used to be pickled, convert old files to json the first time they are loaded. Only files starting with
+    # the pickle protocol header are unpickled, anything else has to be json.
+    if data.startswith(pickle.PROTO):
+        login = pickle.loads(data)
+
+        with path.open('w') as loginFile:
+            json.dump(login, loginFile)
+    else:
+        try:
+            login = json.loads(data)
+        except ValueError as e:
+            raise ValueError(f'{path} is not a valid json login file: {e}') from None
+
+    login['port'] = int(login['port'])
+
+    return cast(Login, login)
 
 
 def createOrLoadLogin(filePath: PathLike) -> Login:
     path = processPath(filePath)
 
     if path.exists():
-        return loadLogin(filePath)
+        return loadLogin(path)
     else:
-        return createLogin(filePath)
+        return createLogin(path)
 
 
 createConnection = connectUsingLoginFunc(createLogin)
@@ -3,8 +3,9 @@ import json
 import warnings
 from abc import ABC
 from enum import Enum
-from functools import partial
-from typing import TYPE_CHECKING, Any, Union, Tuple, Optional, Callable, cast, Type
+from functools import partial, lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Union, Tuple, Optional, Callable, cast, Type, List, Sequence, Dict
 
 from iso8601 import parse_date
 from psycopg import sql
@@ -12,7 +13,7 @@ from psycopg import sql
 from .representations import FixedPointValue
 from .columns import ColumnType, Column
 from .exceptions import PrimaryKeyError, NullValueError, EnumValueError, ArrayLengthWarning
-from .helper import acceptNone, splitNestedString
+from .helper import cachedproperty, splitNestedString, weakValueCache
 from .protocols import DatabaseModel
 
 if TYPE_CHECKING:
@@ -57,19 +58,68 @@ __all__ = [
 TABLE_OR_TABLE_COLUMN = Union['DatabaseModel', Tuple['DatabaseModel', str]]
 
 
+# ciso8601 is an optional, much faster, C implementation of the timestamp parsing
+try:
+    from ciso8601 import parse_datetime
+
+    def parseTimestamp(string: str) -> datetime.datetime:
+        # Treat timestamps without an offset as UTC, the same as iso8601.parse_date
+        parsed = parse_datetime(string)
+
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=datetime.timezone.utc)
+        return parsed
+except ImportError:
+    parseTimestamp = parse_date  # type: ignore
+
+# Likewise orjson is an optional faster replacement for the json module
+try:
+    import orjson
+
+    jsonLoads: Callable[[str], Any] = orjson.loads
+
+    def jsonDumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    jsonLoads = json.loads
+    jsonDumps = json.dumps
+
+
+def createTypeStatement(name: str, definition: 'sql.Composable') -> 'sql.Composed':
+    # Creating and ignoring duplicate_object is atomic and needs no result, so it can be queued in a pipeline
+    return sql.SQL("""
+    DO $$ BEGIN
+        CREATE TYPE {} AS {};
+    EXCEPTION
+        WHEN duplicate_object THEN null;
+    END $$;
+    """).format(sql.Identifier(name), definition)
+
+
 class ForeignKey(ColumnType):
     """
     Defines a column to be a foreign key to a different model.
     """
 
+    __slots__ = ('model', 'schema', 'table', 'column', '_rawType', '_primaryKeyGetter', '_autoFilledKey')
+
     def __init__(self, model: 'DatabaseModel', schema: str, table: str, column: 'Column') -> None:
+        if model.__primary_key__ is None:
+            raise PrimaryKeyError(f'{model} contains no primary key')
+
         self.model = model
 
         self.schema = schema
         self.table = table
         self.column = column
         self._rawType = column.rawType
+        self._primaryKeyGetter = attrgetter(model.__primary_key__.name)
 
+        # An auto filled primary key is only ever set by the database, so models with one set are already saved
+        self._autoFilledKey = model.__primary_key__.name not in model.__arg_names__
+
+    @classmethod
+    @weakValueCache
     def __class_getitem__(cls, key: TABLE_OR_TABLE_COLUMN) -> 'ForeignKey':
         # I really want match statements
         if isinstance(key, DatabaseModel):
@@ -85,7 +135,7 @@ class ForeignKey(ColumnType):
     def rawType(self) -> str:
         return self._rawType
 
-    @property
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL('{} REFERENCES {}.{} ({})').format(
             sql.SQL(self._rawType),
@@ -95,25 +145,31 @@ class ForeignKey(ColumnType):
         )
 
     def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
-        if self.model.__primary_key__ is None:
-            raise PrimaryKeyError(f'{self.model} contains no primary key')
+        return self.convertDataFromStrings(conn, [string])[0]
+
+    def convertDataFromStrings(self, conn: 'connection.Connection[Any]', strings: Sequence[Optional[str]]) -> List[Any]:
+        # Load every referenced model in a single query rather than one per row
+        primaryKeys = self.column.type.convertDataFromStrings(conn, strings)
 
-        if string is None:
-            return None
+        models = self.model.instantiateFromPrimaryKeys(conn, (k for k in primaryKeys if k is not None))
 
-        return self.model.instantiateFromPrimaryKey(conn, string)
+        return [None if k is None else models[k] for k in primaryKeys]
 
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
-        if self.model.__primary_key__ is None:
-            raise PrimaryKeyError(f'{self.model} contains no primary key')
+        return self.convertInsertablesFromData(conn, [data])[0]
 
-        if data is None:
-            return None
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        # Data will be of type self.model, write every unsaved referenced model in one batch then return their primary
+        # keys. The same model may be referenced more than once so they are deduplicated by identity first.
+        getter = self._primaryKeyGetter
+        autoFilledKey = self._autoFilledKey
+
+        unsaved = {id(d): d for d in datas if d is not None and not (autoFilledKey and getter(d) is not None)}
+
+        if unsaved:
+            self.model.insertOrUpdateMany(conn, unsaved.values())
 
-        # Data will be of type self.model so we can get the primary key of data and return it
-        data.insertOrUpdate(conn)
-        
-        return getattr(data, self.model.__primary_key__.name)
+        return [None if d is None else getter(d) for d in datas]
 
     def __str__(self) -> str:
         return f'{self.rawType} REFERENCES "{self.schema}"."{self.table}" ({self.column.name})'
@@ -125,7 +181,9 @@ class FalseForeignKey(ForeignKey):
     for arrays and composite types of foreign keys.
     """
 
-    @property
+    __slots__ = ()
+
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL(self._rawType)
 
@@ -135,15 +193,29 @@ class Composite(ColumnType):
     Creates a composite postgresql type.
     """
 
+    __slots__ = ('name', 'fields', '_createStatement', '_dropStatement')
+
     def __init__(self, name: str, fields: Tuple[Tuple[str, 'ColumnType'], ...]) -> None:
         self.name = name
         self.fields = fields
 
+        self._createStatement = createTypeStatement(name, sql.SQL('({})').format(
+            sql.SQL(', ').join([
+                sql.SQL('{} {}').format(
+                    sql.Identifier(fieldName),
+                    column.typeStatement
+                ) for fieldName, column in fields
+            ])
+        ))
+        self._dropStatement = sql.SQL('DROP TYPE IF EXISTS {} CASCADE;').format(sql.Identifier(name))
+
+    @classmethod
+    @weakValueCache
     def __class_getitem__(cls, definition: Tuple[str, Tuple[Tuple[str, 'ColumnType'], ...]]) -> 'Composite':
         name, fields = definition
         return cls(name, fields)
 
-    @property
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL(self.name)
 
@@ -154,50 +226,41 @@ class Composite(ColumnType):
     def initializeType(self, conn: 'connection.Connection[Any]', recreate: bool) -> None:
         with conn.cursor() as cur:
             if recreate:
-                dropStatement = sql.SQL('DROP TYPE IF EXISTS {} CASCADE;').format(
-                    sql.Identifier(self.name)
-                )
-                cur.execute(dropStatement)
-
-            cur.execute(
-                sql.SQL("""
-                DO $$ BEGIN
-                    CREATE TYPE {} AS ({});
-                EXCEPTION
-                    WHEN duplicate_object THEN null;
-                END $$;
-                """).format(
-                    sql.Identifier(self.name),
-                    sql.SQL(', ').join([
-                        sql.SQL('{} {}').format(
-                            sql.Identifier(name),
-                            column.typeStatement
-                        ) for name, column in self.fields
-                    ])
-                )
-            )
+                cur.execute(self._dropStatement)
 
-    def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
-        columns = (c for _, c in self.fields)
+            cur.execute(self._createStatement)
 
-        return tuple(c.convertDataFromString(conn, i) for c, i in zip(columns, splitNestedString(string)))
+    def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
+        return tuple([c.convertDataFromString(conn, i) for (_, c), i in zip(self.fields, splitNestedString(string))])
 
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
         dataTuple = cast(Tuple[Any], data)
 
-        columns = (c for _, c in self.fields)
+        return tuple([c.convertInsertableFromData(conn, i) for (_, c), i in zip(self.fields, dataTuple)])
+
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        tuples = [d for d in datas if d is not None]
+
+        # Convert each field of every composite together, then put the composites back together
+        convertedFields = [
+            iter(c.convertInsertablesFromData(conn, [t[i] for t in tuples])) for i, (_, c) in enumerate(self.fields)
+        ]
 
-        return tuple(c.convertInsertableFromData(conn, i) for c, i in zip(columns, dataTuple))
+        return [None if d is None else tuple(next(f) for f in convertedFields) for d in datas]
 
 
 class ModifiedColumnType(ColumnType, ABC):
+    __slots__ = ('type',)
+
     def __init__(self, type: 'ColumnType') -> None:
         self.type = type
 
+    @classmethod
+    @weakValueCache
     def __class_getitem__(cls, type: 'ColumnType') -> 'ModifiedColumnType':
         return cls(type)
 
-    @property
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return self.type.typeStatement
 
@@ -212,12 +275,26 @@ class ModifiedColumnType(ColumnType, ABC):
     def primary(self) -> bool:
         return self.type.primary
 
+    @property
+    def loadedNatively(self) -> bool:
+        return self.type.loadedNatively
+
+    @property
+    def dumpedBinary(self) -> bool:
+        return self.type.dumpedBinary
+
     def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
         return self.type.convertDataFromString(conn, string)
 
+    def convertDataFromStrings(self, conn: 'connection.Connection[Any]', strings: Sequence[Optional[str]]) -> List[Any]:
+        return self.type.convertDataFromStrings(conn, strings)
+
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
         return self.type.convertInsertableFromData(conn, data)
 
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        return self.type.convertInsertablesFromData(conn, datas)
+
     def __str__(self) -> str:
         return str(self.type)
 
@@ -227,39 +304,78 @@ class Array(ModifiedColumnType):
     Turns the given collumn into an array, must be used first in any chain of modified types.
     """
 
+    __slots__ = ('length',)
+
     def __init__(self, type: 'ColumnType', length: Optional[int] = None) -> None:
         super().__init__(type)
         self.length = length
 
+    @classmethod
+    @weakValueCache
     def __class_getitem__(cls, items: Union['ColumnType', Tuple['ColumnType', int]]) -> 'ModifiedColumnType':
         # I really want match statements
-        if type(items) == tuple:
+        if type(items) is tuple:
             return cls(*items)
 
         return cls(cast('ColumnType', items))
 
-    @property
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         if self.length is not None:
             return sql.SQL('{}[' + str(self.length) + ']').format(self.type.typeStatement)
         else:
             return sql.SQL('{}[]').format(self.type.typeStatement)
 
+    @property
+    def loadedNatively(self) -> bool:
+        # psycopg parses arrays of types it loads itself, only fixed lengths still need checking here
+        return self.length is None and self.type.loadedNatively
+
+    @property
+    def dumpedBinary(self) -> bool:
+        # Lists of plain ints, floats, strings and bools are sent as binary arrays instead of array literals to parse
+        if isinstance(self.type, LiteralType):
+            return self.type._identityType is not None
+        return self.type.dumpedBinary
+
     def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
-        if string is None:
-            return None
+        return self.convertDataFromStrings(conn, [string])[0]
+
+    def convertDataFromStrings(self, conn: 'connection.Connection[Any]', strings: Sequence[Optional[str]]) -> List[Any]:
+        arrays: List[Optional[List[Optional[str]]]] = []
+
+        for string in strings:
+            if string is None:
+                arrays.append(None)
+                continue
+
+            items = splitNestedString(string)
+
+            if self.length is not None and len(items) != self.length:
+                warnings.warn(f'Expected {self.length} items, got {len(items)} ({string})', ArrayLengthWarning)
+
+            arrays.append([None if item == 'NULL' else item for item in items])
 
-        items = splitNestedString(string)
-        
-        if self.length is not None and len(items) != self.length:
-            warnings.warn(f'Expected {self.length} items, got {len(items)} ({string})', ArrayLengthWarning)
-        
-        return list(self.type.convertDataFromString(conn, None if item == 'NULL' else item) for item in items)
+        # Convert the items of every array together, then split them back up
+        convertedItems = iter(self.type.convertDataFromStrings(
+            conn, [item for items in arrays if items is not None for item in items]
+        ))
+
+        return [None if items is None else [next(convertedItems) for _ in items] for items in arrays]
 
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
-        if data is None:
-            return None
-        return list(self.type.convertInsertableFromData(conn, d) for d in data)
+        return self.convertInsertablesFromData(conn, [data])[0]
+
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        # Array likes such as numpy arrays convert all of their items to Python objects at once with tolist
+        arrays = [None if data is None else data.tolist() if hasattr(data, 'tolist') else list(data) for data in datas]
+
+        # Convert the items of every array together, then split them back up
+        convertedItems = iter(self.type.convertInsertablesFromData(
+            conn, [item for items in arrays if items is not None for item in items]
+        ))
+
+        return [None if items is None else [next(convertedItems) for _ in items] for items in arrays]
 
     def __str__(self) -> str:
         if self.length is not None:
@@ -273,7 +389,9 @@ class NotNull(ModifiedColumnType):
     Requires a column can not be null. Should be applied to most columns.
     """
 
-    @property
+    __slots__ = ()
+
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL('{} NOT NULL').format(self.type.typeStatement)
 
@@ -281,7 +399,14 @@ class NotNull(ModifiedColumnType):
         if data is None:
             raise NullValueError('Attempted to fill NOT NULL field with null')
 
-        return super().convertInsertableFromData(conn, data)
+        # Calls the wrapped type directly rather than through ModifiedColumnType
+        return self.type.convertInsertableFromData(conn, data)
+
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        if any(data is None for data in datas):
+            raise NullValueError('Attempted to fill NOT NULL field with null')
+
+        return self.type.convertInsertablesFromData(conn, datas)
 
     def __str__(self) -> str:
         return str(self.type) + ' NOT NULL'
@@ -292,7 +417,9 @@ class PrimaryKey(ModifiedColumnType):
     Defines this column as the primary key for a table. There can only be one defined for each table.
     """
 
-    @property
+    __slots__ = ()
+
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL('{} PRIMARY KEY').format(self.type.typeStatement)
 
@@ -309,7 +436,9 @@ class Unique(ModifiedColumnType):
     Requires that each value entered into the database is unique for this field.
     """
 
-    @property
+    __slots__ = ()
+
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL('{} UNIQUE').format(self.type.typeStatement)
 
@@ -322,12 +451,23 @@ class LiteralType(ColumnType):
     A basic type. The type name and raw name are the same and there are customizable converter functions.
     """
 
-    def __init__(self, literal: str, converter: Callable[[str], Any], inverse: Callable[[Any], Any]) -> None:
+    __slots__ = ('type', 'converter', 'inverse', 'nativeType', 'cacheConversions', '_identityType')
+
+    def __init__(self, literal: str, converter: Callable[[str], Any], inverse: Callable[[Any], Any],
+                 nativeType: Optional[Type[Any]] = None, *, cacheConversions: bool = False) -> None:
         self.type = literal
-        self.converter = acceptNone(converter)
-        self.inverse = acceptNone(inverse)
+        # None is checked for inline by the conversions rather than by wrapping these
+        self.converter = converter
+        self.inverse = inverse
+        self.nativeType = nativeType
 
-    @property
+        # Only worth it for slow converters returning immutable values, as duplicates share the converted value
+        self.cacheConversions = cacheConversions
+
+        # When the inverse is just the native type's constructor, values already of that type need no conversion
+        self._identityType = nativeType if inverse is nativeType else None
+
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL(self.type)
 
@@ -338,11 +478,51 @@ class LiteralType(ColumnType):
     def rawType(self) -> str:
         return self.type
 
+    @property
+    def loadedNatively(self) -> bool:
+        return self.nativeType is not None
+
     def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
-        return self.converter(string)
+        # psycopg loads most literal types itself, only strings from within arrays or composites need converting
+        if self.nativeType is not None and isinstance(string, self.nativeType):
+            return string
+
+        return None if string is None else self.converter(string)
+
+    def convertDataFromStrings(self, conn: 'connection.Connection[Any]', strings: Sequence[Optional[str]]) -> List[Any]:
+        # The converters are bound once for the whole column instead of going through a method call per value
+        nativeType = self.nativeType
+        converter = self.converter
+
+        if nativeType is None:
+            return [None if string is None else converter(string) for string in strings]
+
+        if self.cacheConversions:
+            # Repeated values, such as from joined rows, are only converted once per batch
+            converted = {
+                string: converter(string) for string in set(strings)
+                if string is not None and not isinstance(string, nativeType)
+            }
+
+            return [
+                string if string is None or isinstance(string, nativeType) else converted[string] for string in strings
+            ]
+
+        return [
+            string if string is None or isinstance(string, nativeType) else converter(string) for string in strings
+        ]
 
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
-        return self.inverse(data)
+        if type(data) is self._identityType:
+            return data
+
+        return None if data is None else self.inverse(data)
+
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        identityType = self._identityType
+        inverse = self.inverse
+
+        return [data if data is None or type(data) is identityType else inverse(data) for data in datas]
 
     def __str__(self) -> str:
         return self.type
@@ -353,66 +533,75 @@ class EnumType(ColumnType):
     A constructed type that can only be one of a few values.
     """
 
+    __slots__ = ('enumType', 'type', 'enums', '_members', '_names', '_createStatement', '_dropStatement')
+
     def __init__(self, enumType: Type[Enum]) -> None:
         self.enumType = enumType
         self.type = enumType.__name__.lower()
         self.enums = tuple(t.name.lower() for t in enumType)
 
-        self._enumConversion = {t.name.lower(): t.name for t in enumType}
+        # Members by their database value and back, so converting is a single dict lookup either way
+        self._members: Dict[Optional[str], Optional[Enum]] = {t.name.lower(): t for t in enumType}
+        # Names are keyed by the members' ids, so values merely equal to a member (like ints for an IntEnum) never match
+        self._names: Dict[int, Optional[str]] = {id(t): t.name.lower() for t in enumType}
+        self._members[None] = self._names[id(None)] = None
+
+        typeIdentifier = sql.Identifier(self.type)
+
+        self._createStatement = createTypeStatement(self.type, sql.SQL('ENUM ({})').format(
+            sql.SQL(', ').join([sql.Literal(e) for e in self.enums])
+        ))
+        self._dropStatement = sql.SQL('DROP TYPE IF EXISTS {} CASCADE;').format(typeIdentifier)
 
+    @classmethod
+    @weakValueCache
     def __class_getitem__(cls, args: Union[Type[Enum], Tuple[str, Tuple[str, ...]]]) -> 'EnumType':
-        if type(args) == tuple:
+        if type(args) is tuple:
             return cls(cast(Type[Enum], Enum(*args)))
         elif issubclass(cast(Type[Enum], args), Enum):
             return cls(cast(Type[Enum], args))
         else:
             raise TypeError(f'{args} is not an enum or enum definition.')
 
-    @property
+    @cachedproperty
     def typeStatement(self) -> 'sql.Composable':
         return sql.SQL(self.type)
 
     def initializeType(self, conn: 'connection.Connection[Any]', recreate: bool) -> None:
         with conn.cursor() as cur:
             if recreate:
-                dropStatement = sql.SQL('DROP TYPE IF EXISTS {} CASCADE;').format(
-                    sql.Identifier(self.type)
-                )
-                cur.execute(dropStatement)
-
-            statement = sql.SQL('''
-            DO $$ BEGIN
-                CREATE TYPE {} AS ENUM ({});
-            EXCEPTION
-                WHEN duplicate_object THEN null;
-            END $$;
-            ''').format(
-                sql.Identifier(self.type),
-                sql.SQL(', ').join(list(map(sql.Literal, self.enums)))
-            )
-            cur.execute(statement)
+                cur.execute(self._dropStatement)
+
+            cur.execute(self._createStatement)
 
     @property
     def rawType(self) -> str:
         return self.type
 
     def convertDataFromString(self, conn: 'connection.Connection[Any]', string: Optional[str]) -> Any:
-        if string is None:
-            return None
+        return self._members[string]
 
-        return self.enumType[self._enumConversion[string]]
+    def convertDataFromStrings(self, conn: 'connection.Connection[Any]', strings: Sequence[Optional[str]]) -> List[Any]:
+        return list(map(self._members.__getitem__, strings))
 
     def convertInsertableFromData(self, conn: 'connection.Connection[Any]', data: Any) -> Any:
-        if data is None:
-            return None
+        # Members and None are looked up directly without checking their type first
+        try:
+            return self._names[id(data)]
+        except KeyError:
+            return self._convertNonMember(data)
 
-        if type(data) == str:
-            data = self.enumType[self._enumConversion[data]]
+    def convertInsertablesFromData(self, conn: 'connection.Connection[Any]', datas: Sequence[Any]) -> List[Any]:
+        try:
+            return list(map(self._names.__getitem__, map(id, datas)))
+        except KeyError:
+            return [self.convertInsertableFromData(conn, data) for data in datas]
 
-        if not isinstance(data, self.enumType):
-            raise EnumValueError(f'Attempted to insert {data} into enum {self.type} which only accepts {self.enums}')
+    def _convertNonMember(self, data: Any) -> Optional[str]:
+        if type(data) is str and data in self._members:
+            return data
 
-        return data.name.lower()
+        raise EnumValueError(f'Attempted to insert {data} into enum {self.type} which only accepts {self.enums}')
 
     def __str__(self) -> str:
         return self.type
@@ -423,8 +612,11 @@ class PseudoType(LiteralType):
     A type with which its name is different than its raw name.
     """
 
-    def __init__(self, name: str, rawName: str, converter: Callable[[str], Any], inverse: Callable[[Any], Any]) -> None:
-        super().__init__(name, converter, inverse)
+    __slots__ = ('rawName',)
+
+    def __init__(self, name: str, rawName: str, converter: Callable[[str], Any], inverse: Callable[[Any], Any],
+                 nativeType: Optional[Type[Any]] = None) -> None:
+        super().__init__(name, converter, inverse, nativeType)
 
         self.rawName = rawName
 
@@ -433,52 +625,64 @@ class PseudoType(LiteralType):
         return self.rawName
 
 
-INTEGER = LiteralType('INTEGER', int, int)
-SERIAL = PseudoType('SERIAL', 'INTEGER', int, int)
-REAL = LiteralType('DOUBLE PRECISION', float, float)
+INTEGER = LiteralType('INTEGER', int, int, int)
+SERIAL = PseudoType('SERIAL', 'INTEGER', int, int, int)
+REAL = LiteralType('DOUBLE PRECISION', float, float, float)
 
-TEXT = LiteralType('TEXT', str, str)
+TEXT = LiteralType('TEXT', str, str, str)
 
 
-TIMESTAMP = LiteralType('TIMESTAMP', parse_date, lambda t: t.isoformat())
-TIMESTAMP_WITH_TIMEZONE = LiteralType('TIMESTAMP WITH TIME ZONE', parse_date, lambda t: t.isoformat())
-DATE = LiteralType('DATE', datetime.date.fromisoformat, lambda t: t.isoformat())
-TIME = LiteralType('TIME', datetime.time.fromisoformat, lambda t: t.isoformat())
+TIMESTAMP = LiteralType('TIMESTAMP', parseTimestamp, lambda t: t.isoformat(), datetime.datetime,
+                        cacheConversions=True)
+TIMESTAMP_WITH_TIMEZONE = LiteralType('TIMESTAMP WITH TIME ZONE', parseTimestamp, lambda t: t.isoformat(),
+                                      datetime.datetime, cacheConversions=True)
+DATE = LiteralType('DATE', datetime.date.fromisoformat, lambda t: t.isoformat(), datetime.date, cacheConversions=True)
+TIME = LiteralType('TIME', datetime.time.fromisoformat, lambda t: t.isoformat(), datetime.time, cacheConversions=True)
 # INTERVAL = LiteralType('INTERVAL', str, str)
 
-JSON = LiteralType('JSON', json.loads, json.dumps)
-JSONB = LiteralType('JSONB', json.loads, json.dumps)
+JSON = LiteralType('JSON', jsonLoads, jsonDumps)
+JSONB = LiteralType('JSONB', jsonLoads, jsonDumps)
 
-BOOL = LiteralType('BOOLEAN', lambda s: s == 't', bool)
+BOOL = LiteralType('BOOLEAN', lambda s: s == 't', bool, bool)
 
 
 class VARCHAR(LiteralType):
+    __slots__ = ()
+
     def __init__(self, n: int, *, _fromGetItem: bool = False) -> None:
         if not _fromGetItem:
             warnings.warn('Use indexing instead of instantiation for VARCHAR types.', DeprecationWarning, 2)
 
         assert n > 0
 
-        super().__init__(f'VARCHAR({n})', str, str)
+        super().__init__(f'VARCHAR({n})', str, str, str)
 
+    @classmethod
+    @lru_cache(maxsize=None)
     def __class_getitem__(cls, n: int) -> 'VARCHAR':
         return cls(n, _fromGetItem=True)
 
 
 class CHAR(LiteralType):
+    __slots__ = ()
+
     def __init__(self, n: int, *, _fromGetItem: bool = False) -> None:
         if not _fromGetItem:
             warnings.warn('Use indexing instead of instantiation for CHAR types.', DeprecationWarning, 2)
 
         assert n > 0
 
-        super().__init__(f'CHAR({n})', str, str)
+        super().__init__(f'CHAR({n})', str, str, str)
 
+    @classmethod
+    @lru_cache(maxsize=None)
     def __class_getitem__(cls, n: int) -> 'CHAR':
         return cls(n, _fromGetItem=True)
 
 
 class NUMERIC(LiteralType):
+    __slots__ = ()
+
     def __init__(self, precision: int, scale: int, *, _fromGetItem: bool = False) -> None:
         if not _fromGetItem:
             warnings.warn('Use indexing instead of instantiation for NUMERIC types.', DeprecationWarning, 2)
@@ -488,6 +692,8 @@ class NUMERIC(LiteralType):
 
         super().__init__(f'NUMERIC({precision}, {scale})', partial(FixedPointValue, precision=precision, scale=scale), str)
 
+    @classmethod
+    @lru_cache(maxsize=None)
     def __class_getitem__(cls, args: Tuple[int, int]) -> 'LiteralType':
         return cls(*args, _fromGetItem=True)
 
@@ -523,6 +729,12 @@ customizableDatatypes = [
 
 
 class SentinelValue:
+    """
+    A marker used as a field default, there is only one of each so always compare with is.
+    """
+
+    __slots__ = ('name',)
+
     def __init__(self, name: str) -> None:
         self.name = name
 
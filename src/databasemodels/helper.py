@@ -1,30 +1,22 @@
-import ast
-from typing import Callable, Any, Optional, Type, TypeVar, List, Union, cast
+import re
 from functools import wraps
+from typing import Callable, Any, Optional, Type, TypeVar, List, Union, Generic, cast, Tuple
+from weakref import WeakValueDictionary
 
 __all__ = [
-    'acceptNone',
     'classproperty',
-    'identity',
-    'splitNestedString'
+    'cachedproperty',
+    'splitNestedString',
+    'weakValueCache'
 ]
 
 
 T = TypeVar('T')
 
-
-def acceptNone(func: Callable[[Any], Any]) -> Callable[[Optional[Any]], Any]:
-    @wraps(func)
-    def wrapper(x: Optional[Any]) -> Any:
-        if x is None:
-            return None
-
-        return func(x)
-    return wrapper
-
-
-def identity(x: T) -> T:
-    return x
+# Quoted strings, runs of plain characters, or single separator/bracket characters
+_ARRAY_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|[^",{}()]+|.', re.DOTALL)
+# Backslash escapes, or doubled quotes inside composites
+_ESCAPED_CHARACTER = re.compile(r'\\(.)|"(")', re.DOTALL)
 
 
 class classproperty:
@@ -36,6 +28,40 @@ class classproperty:
         return self.func(owner)
 
 
+def weakValueCache(func: Callable[..., T]) -> Callable[..., T]:
+    """Much like lru_cache except results are only kept while referenced elsewhere, so they and their arguments can be collected."""
+    cache: 'WeakValueDictionary[Tuple[Any, ...], Any]' = WeakValueDictionary()
+
+    @wraps(func)
+    def wrapper(*args: Any) -> T:
+        try:
+            return cast(T, cache[args])
+        except KeyError:
+            value = cache[args] = func(*args)
+            return value
+
+    return wrapper
+
+
+class cachedproperty(Generic[T]):
+    """Much like property except the getter is only evaluated once, the result is stored on the instance."""
+    def __init__(self, func: Callable[[Any], T]) -> None:
+        self.func = func
+        self.attrName = f'_{func.__name__}Cache'
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance: Any, owner: Type[Any]) -> T:
+        if instance is None:
+            return cast(T, self)
+
+        try:
+            return cast(T, getattr(instance, self.attrName))
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.attrName, value)
+            return value
+
+
 def splitNestedString(arraystring: Optional[Union[str, List[str]]]) -> List[str]:
     """Parses a string from psycopg array/composite type into a list"""
     # Return empty list for null values
@@ -49,39 +75,35 @@ def splitNestedString(arraystring: Optional[Union[str, List[str]]]) -> List[str]
 
     itemstring = arraystring[1:-1]  # Cut off {}
 
-    escaped = False
+    if not itemstring:
+        return [] if arraystring[0] == '{' else ['']
 
-    inString = False
+    # Nothing quoted or nested, let str.split do all the work
+    if '"' not in itemstring and '{' not in itemstring and '(' not in itemstring:
+        return itemstring.split(',')
 
     depth = 0
 
     items = []
     startingIndex = 0
 
-    for i, c in enumerate(itemstring):
-        if c == ',' and not inString and depth == 0:
-            items.append(itemstring[startingIndex:i])
-            startingIndex = i + 1
-
-        if escaped:
-            escaped = False
-        else:
-            if c == '"':
-                inString = not inString
-            elif c == '\\':
-                escaped = True
-
-            # Handle multi-dimensional array strings
-            if not inString:
-                if c == '{' or c == '(':
-                    depth += 1
-                elif c == '}' or c == ')':
-                    depth -= 1
+    for token in _ARRAY_TOKEN.finditer(itemstring):
+        c = token.group()
+
+        if c == ',':
+            if depth == 0:
+                items.append(itemstring[startingIndex:token.start()])
+                startingIndex = token.end()
+        # Handle multi-dimensional array strings
+        elif c == '{' or c == '(':
+            depth += 1
+        elif c == '}' or c == ')':
+            depth -= 1
 
     items.append(itemstring[startingIndex:])
 
     for i, item in enumerate(items):
-        if item[0] == '"':
-            items[i] = ast.literal_eval(item)  # Safely eval strings
+        if item[:1] == '"':
+            items[i] = _ESCAPED_CHARACTER.sub(r'\1\2', item[1:-1])
 
     return items
@@ -1,5 +1,5 @@
-from typing import TYPE_CHECKING, Any, Union, Tuple, Optional, Dict, OrderedDict, \
-    Generator, Type, List, ContextManager
+from typing import TYPE_CHECKING, Any, Union, Tuple, Optional, Dict, \
+    Generator, Type, List, ContextManager, Iterable, Callable, Sequence
 
 from psycopg import sql
 from typing_extensions import Protocol, runtime_checkable
@@ -25,7 +25,12 @@ class Dataclass(Protocol):
 # noinspection PyPropertyDefinition
 @runtime_checkable
 class DatabaseModel(Dataclass, Protocol):
-    __column_definitions__: OrderedDict[str, 'Column']
+    __column_definitions__: Dict[str, 'Column']
+    __columns__: Tuple['Column', ...]
+    __insert_columns__: Tuple['Column', ...]
+    __arg_names__: Tuple[str, ...]
+    __column_names__: Tuple[str, ...]
+    __column_getters__: Tuple[Callable[[Any], Any], ...]
     __primary_key__: Optional['Column']
 
     __schema_name__: str
@@ -33,6 +38,19 @@ class DatabaseModel(Dataclass, Protocol):
 
     __instance_cache__: Dict[Any, 'DatabaseModel']
 
+    __select_statement__: 'sql.Composed'
+    __insert_statement__: 'sql.Composed'
+    __copy_statement__: 'sql.Composed'
+    __update_statement__: Optional['sql.Composed']
+    __upsert_statement__: Optional['sql.Composed']
+
+    # The primary key column, or None if there is no primary key
+    primaryKeyColumn: Optional['Column']
+    # The schema this model uses
+    schema: str
+    # The table name this model uses
+    table: str
+
     @classmethod
     def createTable(cls, conn: 'connection.Connection[Any]', *, recreateSchema: bool = False, recreateTable: bool = False, recreateColumns: bool = False) -> None:
         """
@@ -44,12 +62,12 @@ class DatabaseModel(Dataclass, Protocol):
         :type recreateSchema: bool
         :param recreateTable: if true it will drop the table before recreating it. This will drop any other tables that depend on it
         :type recreateTable: bool
-        :param recreateColumns: if true it will recreate any columns before creating the table.
+        :param recreateColumns: if true it will recreate any columns before creating the table. On autocommit connections column types are only created once per connection unless this is set
         :type recreateColumns: bool
         """
 
     @classmethod
-    def instantiateAll(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '') -> Tuple['DatabaseModel', ...]:
+    def instantiateAll(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '', params: Optional[Sequence[Any]] = None) -> Tuple['DatabaseModel', ...]:
         """
         Instantiate all models of this type with the given query.
 
@@ -57,12 +75,14 @@ class DatabaseModel(Dataclass, Protocol):
         :type conn: connection.Connection[Any]
         :param query: the additional query to use after the select statement
         :type query: Union[str, sql.Composable]
+        :param params: values for any placeholders in the query
+        :type params: Optional[Sequence[Any]]
         :return: a tuple of every model returned from the query
         :rtype: Tuple[DatabaseModel, ...]
         """
 
     @classmethod
-    def instantiateOne(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '') -> 'DatabaseModel':
+    def instantiateOne(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '', params: Optional[Sequence[Any]] = None) -> 'DatabaseModel':
         """
         Instantiate one model of this type with the given query.
 
@@ -70,19 +90,28 @@ class DatabaseModel(Dataclass, Protocol):
         :type conn: connection.Connection[Any]
         :param query: the additional query to use after the select statement
         :type query: Union[str, sql.Composable]
+        :param params: values for any placeholders in the query
+        :type params: Optional[Sequence[Any]]
         :return: a model
         :rtype: DatabaseModel
         """
 
     @classmethod
-    def instantiate(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '') -> Generator['DatabaseModel', None, None]:
+    def instantiate(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '', params: Optional[Sequence[Any]] = None, *, serverSide: bool = False) -> Generator['DatabaseModel', None, None]:
         """
         Instantiate each models of this type with the given query as a generator.
+        With serverSide the rows are kept on the server in a WITH HOLD cursor and fetched in batches as the generator
+        is consumed, which keeps memory bounded for large queries but costs a round trip per batch. Foreign keys in
+        each batch are still loaded with further queries on the same connection while the cursor is open.
 
         :param conn: the connection to use
         :type conn: connection.Connection[Any]
         :param query: the additional query to use after the select statement
         :type query: Union[str, sql.Composable]
+        :param params: values for any placeholders in the query
+        :type params: Optional[Sequence[Any]]
+        :param serverSide: whether to use a server side cursor
+        :type serverSide: bool
         :return: a tuple of every model returned from the query
         :rtype: Tuple[DatabaseModel, ...]
         """
@@ -101,6 +130,20 @@ class DatabaseModel(Dataclass, Protocol):
         :rtype: DatabaseModel
         """
 
+    @classmethod
+    def instantiateFromPrimaryKeys(cls, conn: 'connection.Connection[Any]', primaryKeys: Iterable[Any]) -> Dict[Any, 'DatabaseModel']:
+        """
+        Instantiate the models for each of the given primary keys using a single query. The model must have a primary
+        key.
+
+        :param conn: the connection to use
+        :type conn: connection.Connection[Any]
+        :param primaryKeys: the primary keys to look up
+        :type primaryKeys: Iterable[Any]
+        :return: the models found keyed by their primary key
+        :rtype: Dict[Any, DatabaseModel]
+        """
+
     def insert(self, conn: 'connection.Connection[Any]', commitAfter: bool = False, *, doTypeConversion: bool = True) -> 'DatabaseModel':
         """
         Insert this model into the database.
@@ -113,6 +156,39 @@ class DatabaseModel(Dataclass, Protocol):
         :type commitAfter: bool
         """
 
+    @classmethod
+    def insertMany(cls, conn: 'connection.Connection[Any]', models: Iterable['DatabaseModel'], commitAfter: bool = False, *, doTypeConversion: bool = True) -> List['DatabaseModel']:
+        """
+        Insert several models of this type into the database in one batch.
+
+        :param conn: the connection to use
+        :type conn: connection.Connection[Any]
+        :param models: the models to insert
+        :type models: Iterable[DatabaseModel]
+        :param doTypeConversion: if true a conversion function will be called on each field
+        :type doTypeConversion: bool
+        :param commitAfter: whether to commit to the database after
+        :type commitAfter: bool
+        :return: the inserted models
+        :rtype: List[DatabaseModel]
+        """
+
+    @classmethod
+    def copyMany(cls, conn: 'connection.Connection[Any]', models: Iterable['DatabaseModel'], commitAfter: bool = False, *, doTypeConversion: bool = True) -> None:
+        """
+        Insert several models of this type into the database with COPY, which is faster than insertMany for large
+        batches. Auto filled fields are not filled in on the models afterwards, use insertMany if they are needed.
+
+        :param conn: the connection to use
+        :type conn: connection.Connection[Any]
+        :param models: the models to insert
+        :type models: Iterable[DatabaseModel]
+        :param doTypeConversion: if true a conversion function will be called on each field
+        :type doTypeConversion: bool
+        :param commitAfter: whether to commit to the database after
+        :type commitAfter: bool
+        """
+
     def update(self, conn: 'connection.Connection[Any]', commitAfter: bool = False, *, doTypeConversion: bool = True) -> 'DatabaseModel':
         """
         Update this model in the database, will replace any model currently in the database with the updated values.
@@ -129,14 +205,33 @@ class DatabaseModel(Dataclass, Protocol):
     def insertOrUpdate(self, conn: 'connection.Connection[Any]', commitAfter: bool = False, *, doTypeConversion: bool = True) -> 'DatabaseModel':
         """
         Intelligently either updates or inserts this model into the database. If there was not a row with the primary
-        key this model has it will insert it.
+        key this model has it will insert it, leaving out an auto filled primary key so it is taken from its sequence.
+        When no column is auto filled this is done with a single INSERT ... ON CONFLICT statement.
+
+        :param conn: the connection to use
+        :type conn: connection.Connection[Any]
+        :param doTypeConversion: if true a conversion function will be called on each field
+        :type doTypeConversion: bool
+        :param commitAfter: whether to commit to the database after
+        :type commitAfter: bool
+        """
+
+    @classmethod
+    def insertOrUpdateMany(cls, conn: 'connection.Connection[Any]', models: Iterable['DatabaseModel'], commitAfter: bool = False, *, doTypeConversion: bool = True) -> List['DatabaseModel']:
+        """
+        Insert or update several models of this type at once. Models with a primary key already in the database are
+        updated, the rest are inserted in a single batch.
 
         :param conn: the connection to use
         :type conn: connection.Connection[Any]
+        :param models: the models to insert or update
+        :type models: Iterable[DatabaseModel]
         :param doTypeConversion: if true a conversion function will be called on each field
         :type doTypeConversion: bool
         :param commitAfter: whether to commit to the database after
         :type commitAfter: bool
+        :return: the inserted or updated models
+        :rtype: List[DatabaseModel]
         """
 
     def delete(self, conn: 'connection.Connection[Any]', commitAfter: bool = False) -> bool:
@@ -151,6 +246,18 @@ class DatabaseModel(Dataclass, Protocol):
         :type commitAfter: bool
         """
 
+    @classmethod
+    def truncate(cls, conn: 'connection.Connection[Any]', commitAfter: bool = False) -> None:
+        """
+        Delete every row of this model's table, and of any tables referencing it, restarting its serial columns. The
+        instance cache is cleared too.
+
+        :param conn: the connection to use
+        :type conn: connection.Connection[Any]
+        :param commitAfter: whether to commit to the database after
+        :type commitAfter: bool
+        """
+
     @classmethod
     def getColumn(cls, name: str) -> 'Column':
         """
@@ -162,15 +269,6 @@ class DatabaseModel(Dataclass, Protocol):
         :rtype: Column
         """
 
-    @classproperty
-    def primaryKeyColumn(cls: Type['DatabaseModel']) -> Optional['Column']:
-        """
-        Get the primary key for this model or model type.
-
-        :return: either the primary key column or None
-        :rtype: Optional[Column]
-        """
-
     @property
     def primaryKey(self) -> Optional[Any]:
         """
@@ -180,24 +278,6 @@ class DatabaseModel(Dataclass, Protocol):
         :rtype: Optional[Any]
         """
 
-    @classproperty
-    def schema(cls: Type['DatabaseModel']) -> str:
-        """
-        Get the schema for this model.
-
-        :return: the schema this model uses
-        :rtype: str
-        """
-
-    @classproperty
-    def table(cls: Type['DatabaseModel']) -> str:
-        """
-        Get the table name for this model.
-
-        :return: the table name this model uses
-        :rtype: str
-        """
-
     @classproperty
     def columns(cls: Type['DatabaseModel']) -> List['Column']:
         """
@@ -16,6 +16,8 @@ NUMERIC_VALUE = Union[int, float, 'FixedPointValue']
 
 
 class FixedPointValue:
+    __slots__ = ('_value', 'precision', 'scale', '_maxValue', '_minValue', '_lscale', '_scaleFactor')
+
     @overload
     def __init__(self, value: Union[str, float]) -> None:
         ...
@@ -68,10 +70,22 @@ class FixedPointValue:
         if scale is None or scale < 0:
             raise FixedPointError('Invalid scale')
 
+        self._setScale(precision, scale)
+
+    @classmethod
+    def _fromRaw(cls, value: int, precision: int, scale: int) -> 'FixedPointValue':
+        # Results of arithmetic are already a valid raw value, precision and scale so skip parsing and validation
+        fixed = cls.__new__(cls)
+        fixed._value = value
+        fixed._setScale(precision, scale)
+
+        return fixed
+
+    def _setScale(self, precision: int, scale: int) -> None:
         self.precision = precision
         self.scale = scale
 
-        self._maxValue = 10 ** self.precision
+        self._maxValue = 10 ** precision
         self._minValue = -self._maxValue
 
         self._lscale = precision - scale
@@ -114,7 +128,7 @@ class FixedPointValue:
         if newValue >= self._maxValue:
             raise FixedPointOverflowError(newValue, self._maxValue)
 
-        return FixedPointValue(newValue, self.precision, self.scale)
+        return FixedPointValue._fromRaw(newValue, self.precision, self.scale)
 
     def __sub__(self, other: NUMERIC_VALUE) -> 'FixedPointValue':
         return self + -other
@@ -130,13 +144,13 @@ class FixedPointValue:
 
         value = int(round(self._value * other._value * self._scaleFactor))
 
-        return FixedPointValue(value, self.precision, self.scale)
+        return FixedPointValue._fromRaw(value, self.precision, self.scale)
 
     def __truediv__(self, other: NUMERIC_VALUE) -> 'FixedPointValue':
         return self.divide(other, self.scale + self.precision)
 
     def __neg__(self) -> 'FixedPointValue':
-        return FixedPointValue(-self._value, self.precision, self.scale)
+        return FixedPointValue._fromRaw(-self._value, self.precision, self.scale)
 
     def divide(self, other: NUMERIC_VALUE, newScale: int) -> 'FixedPointValue':
         if type(other) == int or type(other) == float:
@@ -174,4 +188,4 @@ class FixedPointValue:
         if newValue <= -maxValue:
             raise FixedPointUnderflowError(newValue, -maxValue)
 
-        return FixedPointValue(newValue, newPrecision, newScale)
+        return FixedPointValue._fromRaw(newValue, newPrecision, newScale)
@@ -1,12 +1,24 @@
 import dataclasses
-from collections import OrderedDict as OD
-from dataclasses import fields, MISSING
-from typing import Callable, Any, List, Type, Optional, OrderedDict, Dict, Generator, cast, Tuple, Union, ContextManager
-
-from psycopg import connection, sql
+import datetime
+import sys
+from itertools import count
+from contextlib import nullcontext
+from functools import lru_cache
+from dataclasses import MISSING
+from operator import attrgetter
+from weakref import WeakKeyDictionary, ref
+from types import CodeType, FunctionType
+from typing import Callable, Any, List, Type, Optional, Dict, Generator, cast, Tuple, Union, ContextManager, \
+    Iterable, Sequence, Set
+
+from psycopg import connection, cursor, sql, Pipeline, adapters, postgres
+from psycopg.abc import AdaptContext, Buffer
+from psycopg.adapt import PyFormat, Loader
+from psycopg.pq import Format
+from psycopg.types.string import TextLoader
 
 from .datatypes import NO_DEFAULT, AUTO_FILLED
-from .columns import Column
+from .columns import Column, ColumnType
 from .exceptions import PrimaryKeyError, FieldDefaultValueError
 from .protocols import Dataclass, DatabaseModel
 from .helper import classproperty
@@ -16,6 +28,137 @@ __all__ = [
 ]
 
 
+# Number of rows fetched and converted together while instantiating
+INSTANTIATE_BATCH_SIZE = 1000
+
+# Column types created on each open autocommit connection, so createTable does not create them again
+initializedTypes: 'WeakKeyDictionary[connection.Connection[Any], Set[ColumnType]]' = WeakKeyDictionary()
+
+# Server side cursors need a unique name while they are open
+serverCursorIds = count()
+
+# Field defaults a model accepts, compared by id so arbitrary defaults are never compared with ==
+SENTINEL_IDS = frozenset((id(MISSING), id(NO_DEFAULT), id(AUTO_FILLED)))
+
+# Types whose values are parsed by their column type rather than by psycopg
+TEXT_LOADED_TYPES = ('json', 'jsonb', 'numeric')
+
+# psycopg's own loader for timestamps without a time zone, used by UTCTimestampLoader
+TIMESTAMP_LOADER = adapters.get_loader(postgres.types['timestamp'].oid, Format.TEXT)
+
+
+class UTCTimestampLoader(Loader):
+    # Timestamps without a time zone are loaded as UTC, the same as ones parsed from strings by parseTimestamp
+    def __init__(self, oid: int, context: Optional[AdaptContext] = None) -> None:
+        super().__init__(oid, context)
+        self._loader = cast(Type[Loader], TIMESTAMP_LOADER)(oid, context)
+
+    def load(self, data: Buffer) -> datetime.datetime:
+        return cast(datetime.datetime, self._loader.load(data)).replace(tzinfo=datetime.timezone.utc)
+
+
+def resolveAnnotation(cls: Type[Any], annotation: Any) -> Any:
+    # String annotations (such as under "from __future__ import annotations") are evaluated where the class was defined.
+    # typing.get_type_hints can not be used as it rejects annotations which are not types before Python 3.11.
+    if isinstance(annotation, str):
+        return eval(annotation, vars(sys.modules[cls.__module__]), dict(vars(cls)))
+
+    return annotation
+
+
+def placeholder(column: 'Column') -> 'sql.Placeholder':
+    return sql.Placeholder(format=PyFormat.BINARY if column.type.dumpedBinary else PyFormat.AUTO)
+
+
+def tupleGetter(names: Sequence[str]) -> Callable[[Any], Tuple[Any, ...]]:
+    # attrgetter only returns a tuple when given more than one name
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return lambda obj: ()
+
+
+def convertRows(conn: 'connection.Connection[Any]', columns: Sequence['Column'],
+                rows: Sequence[Sequence[Any]]) -> List[List[Any]]:
+    # Each column converts all of its values at once so types like foreign keys can batch their database work
+    if not columns:
+        return [[] for _ in rows]
+
+    convertedColumns = [c.type.convertInsertablesFromData(conn, values) for c, values in zip(columns, zip(*rows))]
+
+    return [list(row) for row in zip(*convertedColumns)]
+
+
+def compileInit(argsNames: Sequence[str], autofilledNames: Sequence[str]) -> Callable[..., None]:
+    # Auto filled fields start as None until the database fills them in
+    settersString = '\n'.join(
+        [f'    self.{a} = {a}' for a in argsNames] + [f'    self.{a} = None' for a in autofilledNames]
+    ) or '    pass'
+
+    miniLocals: Dict[str, Callable[..., None]] = {}
+    exec(f"def __init__({', '.join(['self', *argsNames])}):\n{settersString}\n", {}, miniLocals)
+
+    return miniLocals['__init__']
+
+
+def compileSetValues(names: Sequence[str]) -> Callable[[Any, Sequence[Any]], None]:
+    # Unpacks a whole row into the attributes at once instead of calling setattr for every column
+    if not names:
+        return lambda self, values: None
+
+    miniLocals: Dict[str, Callable[[Any, Sequence[Any]], None]] = {}
+    exec(f"def _setValues(self, values):\n    {', '.join([f'self.{n}' for n in names])}, = values\n", {}, miniLocals)
+
+    return miniLocals['_setValues']
+
+
+@lru_cache(maxsize=None)
+def initTemplate(argsCount: int, autofilledCount: int) -> CodeType:
+    # Compiled once per shape of model, the placeholder names are swapped for the field names in initFunction
+    return compileInit(
+        [f'_a{i}' for i in range(argsCount)],
+        [f'_b{i}' for i in range(autofilledCount)],
+    ).__code__
+
+
+def initFunction(argsNames: Sequence[str], autofilledNames: Sequence[str]) -> Callable[..., None]:
+    # CodeType.replace is new in Python 3.8
+    if not hasattr(CodeType, 'replace'):
+        return compileInit(argsNames, autofilledNames)
+
+    code = initTemplate(len(argsNames), len(autofilledNames)).replace(
+        co_varnames=('self', *argsNames),
+        co_names=(*argsNames, *autofilledNames),
+    )
+
+    return cast(Callable[..., None], FunctionType(code, {}, '__init__'))
+
+
+def pipeline(conn: 'connection.Connection[Any]') -> ContextManager[Any]:
+    # Pipeline mode needs libpq 14 or newer, otherwise statements are just sent one at a time
+    if Pipeline.is_supported():
+        return conn.pipeline()
+
+    return nullcontext()
+
+
+def modelCursor(conn: 'connection.Connection[Any]', serverSide: bool = False) -> 'cursor.Cursor[Any]':
+    # WITH HOLD keeps server side cursors open past the end of their transaction, so they work in autocommit too
+    if serverSide:
+        cur: 'cursor.Cursor[Any]' = conn.cursor(f'databasemodels_{next(serverCursorIds)}', withhold=True)
+    else:
+        cur = conn.cursor()
+
+    for typeName in TEXT_LOADED_TYPES:
+        cur.adapters.register_loader(typeName, TextLoader)
+
+    cur.adapters.register_loader('timestamp', UTCTimestampLoader)
+
+    return cur
+
+
 class MutationContext:
     def __init__(self, connection: 'connection.Connection[Any]', model: 'DatabaseModel',
                  insertOrUpdateOnExit: bool, commitAfter: bool) -> None:
@@ -27,8 +170,8 @@ class MutationContext:
         self.data: Dict[str, Any] = {}
 
     def __enter__(self) -> None:
-        for f in fields(self.model):
-            self.data[f.name] = getattr(self.model, f.name)
+        for name, getter in zip(self.model.__column_names__, self.model.__column_getters__):
+            self.data[name] = getter(self.model)
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         if exc_type is None:
@@ -39,9 +182,38 @@ class MutationContext:
                 setattr(self.model, k, v)
 
 
-def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useInstanceCache: bool = True) -> \
-        Callable[[Type['Dataclass']], Type['DatabaseModel']]:
+def slottedClass(cls: Type[Any], wrappedClass: Type[Any], names: Tuple[str, ...]) -> Type[Any]:
+    # Like dataclasses' slots=True the class is rebuilt on cls's bases, as slots can not remove a base's __dict__
+    inherited = {n for base in cls.__mro__[1:] for n in getattr(base, '__slots__', ())}
+
+    namespace = {
+        k: v for k, v in {**cls.__dict__, **wrappedClass.__dict__}.items()
+        if k not in names and k not in ('__dict__', '__weakref__')
+    }
+
+    namespace['__slots__'] = tuple(n for n in names if n not in inherited)
+
+    metaclass: Any = type(cls)
+
+    return cast(Type[Any], metaclass(cls.__name__, cls.__bases__, namespace))
+
+
+# Models already built from a class by their options, so decorating the same class again with the same options returns
+# the same model. Held weakly, so classes that are no longer used elsewhere are not kept alive by the cache.
+modelCache: 'WeakKeyDictionary[Type[Any], Dict[Tuple[Any, ...], ref[Type[DatabaseModel]]]]' = WeakKeyDictionary()
+
+
+def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useInstanceCache: bool = True,
+          slots: bool = False) -> Callable[[Type['Dataclass']], Type['DatabaseModel']]:
     def wrapped(cls: Union[Type['Dataclass'], Type[Any]]) -> Type['DatabaseModel']:
+        cachedModels = modelCache.setdefault(cls, {})
+        cacheKey = (_schema, _table, useInstanceCache, slots)
+
+        cachedModel = cachedModels[cacheKey]() if cacheKey in cachedModels else None
+
+        if cachedModel is not None:
+            return cachedModel
+
         if not isinstance(cls, Dataclass):
             cls = dataclasses.dataclass(cls)
 
@@ -55,21 +227,27 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
         else:
             schemaName = _schema
 
-        columnDefinitions: OrderedDict[str, 'Column'] = OD()
+        # Names are interned so lookups by them can compare identity first
+        tableName = sys.intern(tableName)
+        schemaName = sys.intern(schemaName)
+
+        columnDefinitions: Dict[str, 'Column'] = {}
         _primaryKey: Optional['Column'] = None
         primaryKeyIndex: Optional[int] = None
 
         argsNames: List[str] = []
-        allFieldsName: List[str] = []
+        autofilledNames: List[str] = []
+
+        # Same as fields(cls) without building a new tuple, ClassVar and InitVar pseudo-fields are still skipped
+        modelFields = [f for f in cls.__dataclass_fields__.values() if f._field_type is dataclasses._FIELD]  # type: ignore
 
-        # PyCharm does not recognize cls as a Dataclass despite being type hinted as one
-        # noinspection PyDataclass
-        for i, field in enumerate(fields(cls)):
-            definition = Column.fromField(field)
+        for i, field in enumerate(modelFields):
+            definition = Column.fromField(field, resolveAnnotation(cls, field.type))
 
-            allFieldsName.append(field.name)
             if field.default is None or field.default is NO_DEFAULT:
-                argsNames.append(field.name)
+                argsNames.append(definition.name)
+            elif field.default is AUTO_FILLED:
+                autofilledNames.append(definition.name)
 
             columnDefinitions[definition.name] = definition
 
@@ -79,22 +257,122 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
                 _primaryKey = definition
                 primaryKeyIndex = i
 
-            if not (field.default is MISSING or field.default is NO_DEFAULT or field.default is AUTO_FILLED):
+            if id(field.default) not in SENTINEL_IDS:
                 raise FieldDefaultValueError(f'{field.name} does not declare default type of MISSING, NO_DEFAULT, '
                                              f'or AUTO_FILLED')
 
-        argsString = ', '.join(argsNames)
-        settersString = '\n'.join(f'    self.{a} = {a}' for a in argsNames)
-
-        replaceAutofilledString = '    for a in dir(self):\n'\
-                                  '        if getattr(self, a) is AUTO_FILLED:\n'\
-                                  '            setattr(self, a, None) '
+        columnsTuple = tuple(columnDefinitions.values())
+        argsTuple = tuple(argsNames)
+        autofilledTuple = tuple(autofilledNames)
+        columnNames = tuple(columnDefinitions.keys())
+        columnGetters = tuple(attrgetter(n) for n in columnNames)
+        columnsGetter = tupleGetter(columnNames)
+        strTemplate = f"{schemaName}.{tableName}(".replace('%', '%%') + ', '.join(f'{n}=%s' for n in columnNames) + ')'
+        nativeColumns = tuple(c.type.loadedNatively for c in columnsTuple)
+
+        # Only the __eq__ dataclass generated is replaced, a user defined one is kept as is
+        dataclassEq = getattr(getattr(cls.__eq__, '__code__', None), 'co_filename', None) == '<string>'
+        replaceEq = dataclassEq and all(f.compare for f in modelFields)
+        insertColumnsTuple = tuple(c for c in columnsTuple if c.name in argsTuple)
+        insertGetter = tupleGetter([c.name for c in insertColumnsTuple])
+
+        # Bound once so converting a single model does not look up every column type's method
+        insertConverters = tuple(c.type.convertInsertableFromData for c in insertColumnsTuple)
+        columnConverters = tuple(c.type.convertInsertableFromData for c in columnsTuple)
+
+        # Statements are built once here and executed with bound parameters
+        schemaIdentifier = sql.Identifier(schemaName)
+        tableIdentifier = sql.Identifier(schemaName, tableName)
+        allColumnsStatement = sql.SQL(', ').join([sql.Identifier(n) for n in columnDefinitions.keys()])
+
+        createSchemaStatement = sql.SQL('CREATE SCHEMA IF NOT EXISTS {};').format(schemaIdentifier)
+        dropSchemaStatement = sql.SQL('DROP SCHEMA IF EXISTS {} CASCADE;').format(schemaIdentifier)
+
+        createTableStatement = sql.SQL('CREATE TABLE IF NOT EXISTS {} ({});').format(
+            tableIdentifier,
+            sql.SQL(', ').join([d.columnDefinition for d in columnDefinitions.values()])
+        )
+        dropTableStatement = sql.SQL('DROP TABLE IF EXISTS {} CASCADE;').format(tableIdentifier)
+        truncateStatement = sql.SQL('TRUNCATE {} RESTART IDENTITY CASCADE;').format(tableIdentifier)
+
+        # Every combination of createTable's recreate flags, keyed by (recreateSchema, recreateTable)
+        createStatements = {
+            (recreateSchema, recreateTable): tuple(
+                ([dropSchemaStatement] if recreateSchema else []) + [createSchemaStatement] +
+                ([dropTableStatement] if recreateTable else []) + [createTableStatement]
+            )
+            for recreateSchema in (False, True) for recreateTable in (False, True)
+        }
+
+        # Columns sharing a type only need it initialized once
+        columnTypes = tuple(dict.fromkeys(c.type for c in columnsTuple))
+
+        selectStatement = sql.SQL('SELECT {} FROM {}').format(allColumnsStatement, tableIdentifier)
+
+        insertStatement = sql.SQL('INSERT INTO {} ({}) VALUES ({}) RETURNING {};').format(
+            tableIdentifier,
+            sql.SQL(', ').join([sql.Identifier(n) for n in argsTuple]),
+            sql.SQL(', ').join([placeholder(c) for c in insertColumnsTuple]),
+            allColumnsStatement
+        )
+
+        copyStatement = sql.SQL('COPY {} ({}) FROM STDIN;').format(
+            tableIdentifier,
+            sql.SQL(', ').join([sql.Identifier(n) for n in argsTuple])
+        )
+
+        updateStatement: Optional['sql.Composed'] = None
+        upsertStatement: Optional['sql.Composed'] = None
+        existingStatement: Optional['sql.Composed'] = None
+        deleteStatement: Optional['sql.Composed'] = None
+        primaryKeyQuery: Optional['sql.Composed'] = None
+        primaryKeysQuery: Optional['sql.Composed'] = None
+
+        if _primaryKey is not None:
+            primaryKeyQuery = sql.SQL('WHERE {} = {} LIMIT 1').format(sql.Identifier(_primaryKey.name), sql.Placeholder())
+            primaryKeysQuery = sql.SQL('WHERE {} = ANY({})').format(sql.Identifier(_primaryKey.name), sql.Placeholder())
+
+            existingStatement = sql.SQL('SELECT {} FROM {} WHERE {} = ANY({});').format(
+                sql.Identifier(_primaryKey.name),
+                tableIdentifier,
+                sql.Identifier(_primaryKey.name),
+                sql.Placeholder()
+            )
+            deleteStatement = sql.SQL('DELETE FROM {} WHERE {} = {} RETURNING {};').format(
+                tableIdentifier,
+                sql.Identifier(_primaryKey.name),
+                sql.Placeholder(),
+                sql.Identifier(_primaryKey.name)
+            )
+
+            # Only when no column is auto filled, otherwise new rows would miss their defaults. An auto filled primary key
+            # written explicitly would also never advance its sequence, so those go through insertOrUpdateMany instead.
+            if not autofilledTuple:
+                upsertStatement = sql.SQL('INSERT INTO {} ({}) VALUES ({}) ON CONFLICT ({}) DO UPDATE SET {} RETURNING {};').format(
+                    tableIdentifier,
+                    allColumnsStatement,
+                    sql.SQL(', ').join([placeholder(c) for c in columnsTuple]),
+                    sql.Identifier(_primaryKey.name),
+                    sql.SQL(', ').join([sql.SQL('{0} = EXCLUDED.{0}').format(sql.Identifier(n)) for n in columnNames]),
+                    allColumnsStatement
+                )
 
-        funcString = f"def __init__(self, {argsString}):\n{settersString}\n{replaceAutofilledString}"
+            updateStatement = sql.SQL('UPDATE {} SET ({}) = ({}) WHERE {} = {};').format(
+                tableIdentifier,
+                allColumnsStatement,
+                sql.SQL(', ').join([placeholder(c) for c in columnsTuple]),
+                sql.Identifier(_primaryKey.name),
+                sql.Placeholder()
+            )
 
         # mypy doesn't support this yet so have to silence the error
         class WrappedClass(cls):  # type: ignore
-            __column_definitions__: OrderedDict[str, 'Column'] = columnDefinitions
+            __column_definitions__: Dict[str, 'Column'] = columnDefinitions
+            __columns__: Tuple['Column', ...] = columnsTuple
+            __insert_columns__: Tuple['Column', ...] = insertColumnsTuple
+            __arg_names__: Tuple[str, ...] = argsTuple
+            __column_names__: Tuple[str, ...] = columnNames
+            __column_getters__: Tuple[Callable[[Any], Any], ...] = columnGetters
             __primary_key__: Optional['Column'] = _primaryKey
 
             __schema_name__: str = schemaName
@@ -102,148 +380,168 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
 
             __instance_cache__: Dict[Any, 'WrappedClass'] = {}
 
-            def _create(self, conn: 'connection.Connection[Any]', record: Tuple[Any, ...]) -> None:
-                kwargs = {}
+            __select_statement__: 'sql.Composed' = selectStatement
+            __insert_statement__: 'sql.Composed' = insertStatement
+            __copy_statement__: 'sql.Composed' = copyStatement
+            __update_statement__: Optional['sql.Composed'] = updateStatement
+            __upsert_statement__: Optional['sql.Composed'] = upsertStatement
 
-                for kc, v in zip(WrappedClass.__column_definitions__.items(), record):
-                    k, c = kc
-                    kwargs[k] = c.type.convertDataFromString(conn, v)
+            @classmethod
+            def _convertRecords(cls, conn: 'connection.Connection[Any]',
+                                records: Sequence[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+                # Converts column by column so types like foreign keys can load a whole column at once
+                convertedColumns = [
+                    values if native else c.type.convertDataFromStrings(conn, values)
+                    for c, native, values in zip(cls.__columns__, nativeColumns, zip(*records))
+                ]
 
-                for k, v in kwargs.items():
-                    setattr(self, k, v)
+                return list(zip(*convertedColumns))
 
-            def __str__(self) -> str:
-                dictlike = ', '.join(f'{a}={getattr(self, a)}' for a in self.__column_definitions__.keys())
-                return f'{self.__schema_name__}.{self.__table_name__}({dictlike})'
+            _setValues = compileSetValues(columnNames)
 
-            def __repr__(self) -> str:
-                return str(self)
+            def _create(self, conn: 'connection.Connection[Any]', record: Tuple[Any, ...]) -> None:
+                self._setValues(self._convertRecords(conn, [record])[0])
 
-            def __dir__(self) -> List[str]:
-                return list(set(dir(type(self)) + list(self.__dict__.keys())))
+            def __str__(self) -> str:
+                return strTemplate % columnsGetter(self)
 
-            @classmethod
-            def getColumn(cls, name: str) -> 'Column':
-                return cls.__column_definitions__[name]
+            __repr__ = __str__
 
-            @classproperty
-            def primaryKeyColumn(cls: Type['DatabaseModel']) -> Optional['Column']:
-                return cls.__primary_key__
+            if replaceEq:
+                # Compares every column with one C level attrgetter per side instead of building tuples in bytecode
+                def __eq__(self, other: Any) -> bool:
+                    if other.__class__ is self.__class__:
+                        return bool(columnsGetter(self) == columnsGetter(other))
+                    return NotImplemented
 
-            @property
-            def primaryKey(self) -> Optional[Any]:
-                primary = self.primaryKeyColumn
-                if primary is None:
-                    return None
-                return getattr(self, primary.name)
+                # Defining __eq__ would otherwise clear the hash dataclass chose
+                __hash__ = cls.__hash__
 
-            @classproperty
-            def schema(cls: Type['DatabaseModel']) -> str:
-                return cls.__schema_name__
+            # The dict's own lookup, so getting a column does not go through a Python level call
+            getColumn = staticmethod(columnDefinitions.__getitem__)
 
-            @classproperty
-            def table(cls: Type['DatabaseModel']) -> str:
-                return cls.__table_name__
+            # These never change after decoration so they are stored directly instead of going through properties
+            primaryKeyColumn: Optional['Column'] = _primaryKey
+            schema: str = schemaName
+            table: str = tableName
+
+            primaryKey = property(
+                attrgetter(_primaryKey.name) if _primaryKey is not None else lambda self: None
+            )
 
             @classproperty
             def columns(cls: Type['DatabaseModel']) -> List['Column']:
-                return list(cls.__column_definitions__.values())
+                return list(cls.__columns__)
 
             @classmethod
             def createTable(cls, conn: 'connection.Connection[Any]', *, recreateSchema: bool = False,
                             recreateTable: bool = False, recreateColumns: bool = False) -> None:
-                for defini in cls.columns:
-                    defini.initialize(conn, recreateColumns)
-
-                createSchema = sql.SQL(
-                    'CREATE SCHEMA IF NOT EXISTS {};'
-                ).format(
-                    sql.Identifier(schemaName)
-                )
+                initialized = initializedTypes.get(conn, set())
+                uninitialized = [t for t in columnTypes if recreateColumns or t not in initialized]
 
-                createTable = sql.SQL(
-                    'CREATE TABLE IF NOT EXISTS {} ({});'
-                ).format(
-                    sql.Identifier(schemaName, tableName),
-                    sql.SQL(', ').join(
-                        [d.columnDefinition for d in cls.columns]
-                    )
-                )
+                with pipeline(conn):
+                    # Type creation ignores types that already exist, so nothing is read back before the table DDL
+                    for columnType in uninitialized:
+                        columnType.initializeType(conn, recreateColumns)
 
-                with conn.cursor() as cur:
-                    if recreateSchema:
-                        cur.execute(sql.SQL('DROP SCHEMA IF EXISTS {} CASCADE').format(
-                            sql.Identifier(schemaName)
-                        ))
+                    # Executed one at a time, as the pipeline's extended protocol rejects several commands in one
+                    # string, but still sent together and synced once when the pipeline exits
+                    with conn.cursor() as cur:
+                        for statement in createStatements[recreateSchema, recreateTable]:
+                            cur.execute(statement)
 
-                    cur.execute(createSchema)
+                # Only remembered once the pipeline has synced without errors, and only in autocommit where the types
+                # are already committed, inside a transaction a rollback would drop them again
+                if conn.autocommit:
+                    initializedTypes.setdefault(conn, set()).update(uninitialized)
 
-                    if recreateTable:
-                        cur.execute(sql.SQL('DROP TABLE IF EXISTS {} CASCADE').format(
-                            sql.Identifier(schemaName, tableName)
-                        ))
+            @classmethod
+            def instantiateAll(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '',
+                               params: Optional[Sequence[Any]] = None) -> Tuple['WrappedClass', ...]:
+                # Every row is fetched anyway, so they are all converted together rather than in batches
+                with modelCursor(conn) as cur:
+                    cur.execute(cls._queryStatement(query), params)
 
-                    cur.execute(createTable)
+                    return tuple(cls._instantiateRecords(conn, cur.fetchall()))
 
             @classmethod
-            def instantiateAll(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '') -> Tuple['WrappedClass', ...]:
-                return tuple(cls.instantiate(conn, query))
+            def instantiateOne(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '',
+                               params: Optional[Sequence[Any]] = None) -> 'WrappedClass':
+                # Only the one row returned is converted, rather than a whole batch like instantiate
+                with modelCursor(conn) as cur:
+                    cur.execute(cls._queryStatement(query), params)
+
+                    record = cur.fetchone()
+
+                # Same as exhausting instantiate when nothing matches the query
+                if record is None:
+                    raise StopIteration
+
+                return cls._instantiateRecords(conn, [record])[0]
 
             @classmethod
-            def instantiateOne(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '') -> 'WrappedClass':
-                return next(cls.instantiate(conn, query))
+            def instantiate(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '',
+                            params: Optional[Sequence[Any]] = None, *,
+                            serverSide: bool = False) -> Generator['WrappedClass', None, None]:
+                # A server side cursor only sends each batch when it is fetched rather than every row up front
+                with modelCursor(conn, serverSide) as cur:
+                    cur.execute(cls._queryStatement(query), params)
+
+                    records = cur.fetchmany(INSTANTIATE_BATCH_SIZE)
+
+                    while records:
+                        yield from cls._instantiateRecords(conn, records)
+
+                        records = cur.fetchmany(INSTANTIATE_BATCH_SIZE)
 
             @classmethod
-            def instantiate(cls, conn: 'connection.Connection[Any]', query: Union[str, 'sql.Composable'] = '') -> \
-                    Generator['WrappedClass', None, None]:
+            def _queryStatement(cls, query: Union[str, 'sql.Composable']) -> 'sql.Composed':
                 if isinstance(query, sql.Composable):
                     additionalQuery = query
                 else:
                     additionalQuery = sql.SQL(query)
 
-                queryStatement = sql.SQL('SELECT ({}) FROM {} {};').format(
-                    sql.SQL(', ').join(
-                        [sql.Identifier(c.name) for c in cls.columns]
-                    ),
-                    sql.Identifier(schemaName, tableName),
-                    additionalQuery
-                )
-
-                with conn.cursor() as cur:
-                    cur.execute(queryStatement)
+                return sql.Composed([cls.__select_statement__, sql.SQL(' '), additionalQuery, sql.SQL(';')])
 
-                    record = cur.fetchone()
+            @classmethod
+            def _instantiateRecords(cls, conn: 'connection.Connection[Any]',
+                                    records: Sequence[Tuple[Any, ...]]) -> List['WrappedClass']:
+                if cls.__primary_key__ is None:
+                    # __init__ is skipped entirely, every field is set from the record straight after
+                    objs = [cls.__new__(cls) for _ in records]
 
-                    while record is not None:
-                        record = record[0]
-                        if type(record) != tuple:
-                            record = (record,)
+                    for obj, values in zip(objs, cls._convertRecords(conn, records)):
+                        obj._setValues(values)
 
-                        if cls.__primary_key__ is None:
-                            # Abuse duck-typing to get "2 init methods" sort of
-                            obj = cls(*argsNames)
+                    return objs
 
-                            obj._create(conn, record)
+                primaryKeys = cls.__primary_key__.type.convertDataFromStrings(
+                    conn, [r[cast(int, primaryKeyIndex)] for r in records]
+                )
 
-                            record = cur.fetchone()
+                objs = []
+                created = []
+                createdRecords = []
 
-                            yield obj
-                        else:
-                            primaryKey = cls.__primary_key__.type.convertDataFromString(conn, record[primaryKeyIndex])
+                for primaryKey, record in zip(primaryKeys, records):
+                    if useInstanceCache and primaryKey in cls.__instance_cache__:
+                        obj = cls.__instance_cache__[primaryKey]
+                    else:
+                        obj = cls.__new__(cls)
 
-                            if useInstanceCache and primaryKey in cls.__instance_cache__:
-                                obj = cls.__instance_cache__[primaryKey]
-                            else:
-                                obj = cls(*argsNames)
+                        created.append(obj)
+                        createdRecords.append(record)
 
-                                obj._create(conn, record)
+                    if useInstanceCache:
+                        cls.__instance_cache__[primaryKey] = obj
 
-                            if useInstanceCache:
-                                cls.__instance_cache__[primaryKey] = obj
+                    objs.append(obj)
 
-                            record = cur.fetchone()
+                if createdRecords:
+                    for obj, values in zip(created, cls._convertRecords(conn, createdRecords)):
+                        obj._setValues(values)
 
-                            yield obj
+                return objs
 
             @classmethod
             def instantiateFromPrimaryKey(cls, conn: 'connection.Connection[Any]', primaryKey: Any) -> 'DatabaseModel':
@@ -253,55 +551,130 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
                 if useInstanceCache and primaryKey in cls.__instance_cache__:
                     return cls.__instance_cache__[primaryKey]
 
-                obj = cls.instantiateOne(conn, sql.SQL('WHERE {} = {}').format(
-                    sql.Identifier(cls.__primary_key__.name),
-                    sql.Literal(primaryKey)
-                ))
+                with modelCursor(conn) as cur:
+                    cur.execute(cls._queryStatement(cast('sql.Composed', primaryKeyQuery)), (primaryKey,), prepare=True)
+
+                    record = cur.fetchone()
+
+                if record is None:
+                    raise StopIteration
+
+                obj = cls._instantiateRecords(conn, [record])[0]
 
                 if useInstanceCache:
                     cls.__instance_cache__[primaryKey] = obj
 
                 return obj
 
+            @classmethod
+            def instantiateFromPrimaryKeys(cls, conn: 'connection.Connection[Any]',
+                                           primaryKeys: Iterable[Any]) -> Dict[Any, 'WrappedClass']:
+                if cls.__primary_key__ is None:
+                    raise PrimaryKeyError(f'Model {cls.__name__} has no primary key to instantiate from')
+
+                objs: Dict[Any, 'WrappedClass'] = {}
+                missing = []
+
+                for primaryKey in dict.fromkeys(primaryKeys):
+                    if useInstanceCache and primaryKey in cls.__instance_cache__:
+                        objs[primaryKey] = cls.__instance_cache__[primaryKey]
+                    else:
+                        missing.append(primaryKey)
+
+                if missing:
+                    for obj in cls.instantiate(conn, cast('sql.Composed', primaryKeysQuery), (missing,)):
+                        objs[obj.primaryKey] = obj
+
+                return objs
+
+            def _insertData(self, conn: 'connection.Connection[Any]', doTypeConversion: bool) -> List[Any]:
+                values = insertGetter(self)
+
+                if doTypeConversion:
+                    return [convert(conn, v) for convert, v in zip(insertConverters, values)]
+                return list(values)
+
+            def _inserted(self, values: Tuple[Any, ...]) -> None:
+                # After insertion of this object go back and fill in any defaulted fields
+                self._setValues(values)
+
+                if self.__primary_key__ is not None and useInstanceCache:
+                    self.__instance_cache__[self.primaryKey] = self
+
             def insert(self, conn: 'connection.Connection[Any]', commitAfter: bool = False, *, doTypeConversion: bool = True) -> 'DatabaseModel':
+                data = self._insertData(conn, doTypeConversion)
+
+                with modelCursor(conn) as cur:
+                    cur.execute(self.__insert_statement__, data, prepare=True)
+
+                    record = cast(Tuple[Any, ...], cur.fetchone())
+
+                    self._inserted(self._convertRecords(conn, [record])[0])
+
+                if commitAfter:
+                    conn.commit()
+
+                return self
+
+            @classmethod
+            def insertMany(cls, conn: 'connection.Connection[Any]', models: Iterable['WrappedClass'],
+                           commitAfter: bool = False, *, doTypeConversion: bool = True) -> List['WrappedClass']:
+                models = list(models)
+
+                if not models:
+                    return models
+
                 if doTypeConversion:
-                    data = [c.type.convertInsertableFromData(conn, getattr(self, c.name)) for c in self.columns if c.name in argsNames]
+                    data = convertRows(conn, cls.__insert_columns__, [insertGetter(m) for m in models])
                 else:
-                    data = [getattr(self, c.name) for c in self.columns if c.name in argsNames]
-
-                allColumns = [sql.Identifier(c.name) for c in self.columns]
-
-                insertStatement = sql.SQL('INSERT INTO {} ({}) VALUES ({}) RETURNING ({});').format(
-                    sql.Identifier(schemaName, tableName),
-                    sql.SQL(', ').join(
-                        [sql.Identifier(c.name) for c in self.columns if c.name in argsNames]
-                    ),
-                    sql.SQL(', ').join(
-                        list(map(sql.Literal, data))
-                    ),
-                    sql.SQL(', ').join(
-                        allColumns
-                    )
-                )
+                    data = [list(insertGetter(m)) for m in models]
 
-                with conn.cursor() as cur:
-                    cur.execute(insertStatement)
+                with modelCursor(conn) as cur:
+                    cur.executemany(cls.__insert_statement__, data, returning=True)
+
+                    # Each inserted row is its own result set
+                    records = []
+
+                    for _ in models:
+                        records.append(cast(Tuple[Any, ...], cur.fetchone()))
+                        cur.nextset()
+
+                    for m, values in zip(models, cls._convertRecords(conn, records)):
+                        m._inserted(values)
+
+                if commitAfter:
+                    conn.commit()
 
-                    # After insertion of this object go back and fill in any defaulted fields
-                    record = cast(Tuple[Any], cur.fetchone())[0]
+                return models
 
-                    if type(record) != tuple:
-                        record = (record,)
+            @classmethod
+            def copyMany(cls, conn: 'connection.Connection[Any]', models: Iterable['WrappedClass'],
+                         commitAfter: bool = False, *, doTypeConversion: bool = True) -> None:
+                models = list(models)
 
-                    self._create(conn, record)
+                if not models:
+                    return
 
-                    if self.__primary_key__ is not None and useInstanceCache:
-                        self.__instance_cache__[self.primaryKey] = self
+                if doTypeConversion:
+                    data = convertRows(conn, cls.__insert_columns__, [insertGetter(m) for m in models])
+                else:
+                    data = [list(insertGetter(m)) for m in models]
+
+                # COPY streams every row in one statement, but can not return the auto filled values
+                with conn.cursor() as cur:
+                    with cur.copy(cls.__copy_statement__) as copy:
+                        for row in data:
+                            copy.write_row(row)
 
                 if commitAfter:
                     conn.commit()
 
-                return self
+            def _updateData(self, conn: 'connection.Connection[Any]', doTypeConversion: bool) -> List[Any]:
+                values = columnsGetter(self)
+
+                if doTypeConversion:
+                    return [*[convert(conn, v) for convert, v in zip(columnConverters, values)], self.primaryKey]
+                return [*values, self.primaryKey]
 
             def update(self, conn: 'connection.Connection[Any]', commitAfter: bool = False, *, doTypeConversion: bool = True) -> 'DatabaseModel':
                 primary = self.primaryKeyColumn
@@ -309,25 +682,10 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
                 if primary is None:
                     raise PrimaryKeyError('Can not update a database model without a primary key.')
 
-                if doTypeConversion:
-                    data = [c.type.convertInsertableFromData(conn, getattr(self, c.name)) for c in self.columns]
-                else:
-                    data = [getattr(self, c.name) for c in self.columns]
-
-                updateStatement = sql.SQL('UPDATE {} SET ({}) = ({}) WHERE {} = {};').format(
-                    sql.Identifier(schemaName, tableName),
-                    sql.SQL(', ').join(
-                        [sql.Identifier(c.name) for c in self.columns]
-                    ),
-                    sql.SQL(', ').join(
-                        list(map(sql.Literal, data))
-                    ),
-                    sql.Identifier(primary.name),
-                    sql.Literal(self.primaryKey)
-                )
+                updateStatement = cast('sql.Composed', self.__update_statement__)
 
                 with conn.cursor() as cur:
-                    cur.execute(updateStatement)
+                    cur.execute(updateStatement, self._updateData(conn, doTypeConversion), prepare=True)
 
                 if commitAfter:
                     conn.commit()
@@ -339,17 +697,77 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
                     raise PrimaryKeyError('Can not insert/update a database model without a primary key.')
 
                 if self.primaryKey is None:
-                    return self.insert(conn, doTypeConversion=doTypeConversion)
+                    return self.insert(conn, commitAfter=commitAfter, doTypeConversion=doTypeConversion)
 
-                instances = WrappedClass.instantiateAll(conn, sql.SQL('WHERE {} = {}').format(
-                    sql.Identifier(self.primaryKeyColumn.name),
-                    sql.Literal(self.primaryKey)
-                ))
+                if self.__upsert_statement__ is None:
+                    self.insertOrUpdateMany(conn, [self], commitAfter, doTypeConversion=doTypeConversion)
 
-                if len(instances) == 0:
-                    return self.insert(conn, commitAfter=commitAfter, doTypeConversion=doTypeConversion)
+                    return self
+
+                values = columnsGetter(self)
+
+                if doTypeConversion:
+                    data = [convert(conn, v) for convert, v in zip(columnConverters, values)]
                 else:
-                    return self.update(conn, commitAfter=commitAfter, doTypeConversion=doTypeConversion)
+                    data = list(values)
+
+                # A single statement either inserts the row or updates the one already using this primary key
+                with modelCursor(conn) as cur:
+                    cur.execute(self.__upsert_statement__, data, prepare=True)
+
+                    record = cast(Tuple[Any, ...], cur.fetchone())
+
+                    self._inserted(self._convertRecords(conn, [record])[0])
+
+                if commitAfter:
+                    conn.commit()
+
+                return self
+
+            @classmethod
+            def insertOrUpdateMany(cls, conn: 'connection.Connection[Any]', models: Iterable['WrappedClass'],
+                                   commitAfter: bool = False, *, doTypeConversion: bool = True) -> List['WrappedClass']:
+                primary = cls.primaryKeyColumn
+
+                if primary is None:
+                    raise PrimaryKeyError('Can not insert/update a database model without a primary key.')
+
+                models = list(models)
+                keyed = [m for m in models if m.primaryKey is not None]
+                existing = set()
+
+                # Which models are already in the database is found with one query rather than one per model
+                if keyed:
+                    if doTypeConversion:
+                        keys = [primary.type.convertInsertableFromData(conn, m.primaryKey) for m in keyed]
+                    else:
+                        keys = [m.primaryKey for m in keyed]
+
+                    with modelCursor(conn) as cur:
+                        cur.execute(cast('sql.Composed', existingStatement), [keys], prepare=True)
+
+                        existing = set(primary.type.convertDataFromStrings(conn, [r[0] for r in cur]))
+
+                toUpdate = [m for m in keyed if m.primaryKey in existing]
+
+                if toUpdate:
+                    if doTypeConversion:
+                        rows = convertRows(conn, cls.__columns__, [columnsGetter(m) for m in toUpdate])
+                    else:
+                        rows = [list(columnsGetter(m)) for m in toUpdate]
+
+                    with conn.cursor() as cur:
+                        cur.executemany(
+                            cast('sql.Composed', cls.__update_statement__),
+                            [[*row, m.primaryKey] for row, m in zip(rows, toUpdate)]
+                        )
+
+                cls.insertMany(conn, [m for m in models if m.primaryKey not in existing], doTypeConversion=doTypeConversion)
+
+                if commitAfter:
+                    conn.commit()
+
+                return models
 
             def delete(self, conn: 'connection.Connection[Any]', commitAfter: bool = False) -> bool:
                 if self.primaryKeyColumn is None:
@@ -358,15 +776,8 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
                 if self.primaryKey is None:  # Never was in the database so it was "deleted"
                     return True
 
-                deleteStatement = sql.SQL('DELETE FROM {} WHERE {} = {} RETURNING {}').format(
-                    sql.Identifier(schemaName, tableName),
-                    sql.Identifier(self.primaryKeyColumn.name),
-                    sql.Literal(self.primaryKey),
-                    sql.Identifier(self.primaryKeyColumn.name)
-                )
-
                 with conn.cursor() as cur:
-                    cur.execute(deleteStatement)
+                    cur.execute(cast('sql.Composed', deleteStatement), (self.primaryKey,), prepare=True)
 
                     returnValue = cur.fetchone() is not None
 
@@ -375,16 +786,26 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
 
                 return returnValue
 
-            def mutate(self, conn: 'connection.Connection[Any]', updateOnExit: bool, commitAfter: bool = False) -> ContextManager[None]:
-                return MutationContext(conn, self, updateOnExit, commitAfter)
+            @classmethod
+            def truncate(cls, conn: 'connection.Connection[Any]', commitAfter: bool = False) -> None:
+                with conn.cursor() as cur:
+                    cur.execute(truncateStatement)
 
-        miniLocals: Dict[str, Callable[..., None]] = {}
+                # Cached instances would otherwise be returned for the restarted primary keys
+                cls.__instance_cache__.clear()
 
-        # Builds init method
-        exec(funcString, {'AUTO_FILLED': AUTO_FILLED}, miniLocals)
+                if commitAfter:
+                    conn.commit()
+
+            def mutate(self, conn: 'connection.Connection[Any]', updateOnExit: bool, commitAfter: bool = False) -> ContextManager[None]:
+                return MutationContext(conn, self, updateOnExit, commitAfter)
 
         # Ignored because this must be done to set init method properly
-        WrappedClass.__init__ = miniLocals['__init__']  # type: ignore
+        WrappedClass.__init__ = initFunction(argsTuple, autofilledTuple)  # type: ignore
+
+        if slots:
+            # Rebinding the name keeps the methods' references to WrappedClass pointing at the final class
+            WrappedClass = slottedClass(cls, WrappedClass, columnNames)  # type: ignore
 
         # Transfer wrapped class data over
         WrappedClass.__module__ = cls.__module__
@@ -392,6 +813,8 @@ def model(_schema: Optional[str] = None, _table: Optional[str] = None, *, useIns
         WrappedClass.__qualname__ = cls.__qualname__
         WrappedClass.__doc__ = cls.__doc__
 
+        cachedModels[cacheKey] = ref(WrappedClass)
+
         return WrappedClass
 
     return wrapped
@@ -0,0 +1,5 @@
+import datetime
+
+
+def parse_datetime(datetimestring: str) -> 'datetime.datetime':
+    ...
@@ -0,0 +1,12 @@
+from typing import Any, Optional, Union
+
+
+OPT_NON_STR_KEYS: int
+
+
+def dumps(obj: Any, default: Optional[Any] = None, option: Optional[int] = None) -> bytes:
+    ...
+
+
+def loads(obj: Union[bytes, bytearray, memoryview, str]) -> Any:
+    ...
@@ -1,11 +1,23 @@
 import unittest
+from typing import Any, Tuple
+
 from src import databasemodels as dbm
 
 
 class ConnectionUnitTest(unittest.TestCase):
+    # Models whose tables are emptied before each test, tables are created once per class in setUpClass
+    models: Tuple[Any, ...] = ()
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Connections are cached per login, so every test reuses the same one instead of reconnecting
+        cls.conn = dbm.createOrLoadConnection('../login.json')
+
     def setUp(self) -> None:
-        self.conn = dbm.createOrLoadConnection('../login.pkl')
+        # Truncating is much cheaper than dropping and recreating the tables for every test
+        for model in self.models:
+            model.truncate(self.conn)
 
     def tearDown(self) -> None:
-        self.conn.commit()
-        self.conn.close()
+        # Nothing a test writes needs to persist, rolling back avoids flushing a commit to disk after every test
+        self.conn.rollback()
@@ -0,0 +1,37 @@
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.databasemodels.connection import loadLogin
+
+
+class TestLoadLogin(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        self.path = Path(directory.name) / 'login.json'
+        self.login = dict(dbname='db', user='user', password='password', host='localhost', port=5432)
+
+    def test_json(self) -> None:
+        self.path.write_text(json.dumps(self.login))
+
+        self.assertEqual(loadLogin(self.path), self.login)
+
+    def test_pickle(self) -> None:
+        self.path.write_bytes(pickle.dumps(self.login))
+
+        self.assertEqual(loadLogin(self.path), self.login)
+        self.assertEqual(json.loads(self.path.read_text()), self.login)
+
+    def test_malformed(self) -> None:
+        self.path.write_text(json.dumps(self.login)[:-5])
+
+        with self.assertRaisesRegex(ValueError, 'not a valid json login file'):
+            loadLogin(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,16 +1,19 @@
+import gc
 import unittest
+import weakref
 
 from dataclasses import dataclass
 
 from src import databasemodels as dbm
 from src.databasemodels.datatypes import *
+from src.databasemodels.exceptions import EnumValueError
 
 from helper import ConnectionUnitTest
 
 import datetime as dt
 import pytz
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 
 
 class EnumExample(Enum):
@@ -21,10 +24,11 @@ class EnumExample(Enum):
 
 
 class TestDatatypes(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-        @dbm.model('unittests', 'numerictypes', useInstanceCache=False)
+        @dbm.model('unittests', 'numerictypes', useInstanceCache=False, slots=True)
         @dataclass
         class Numeric:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
@@ -33,9 +37,9 @@ class TestDatatypes(ConnectionUnitTest):
             numeric1: NotNull[NUMERIC[6, 3]] = NO_DEFAULT
             numeric2: NotNull[NUMERIC(6, 3)] = NO_DEFAULT
 
-        self.Numeric = Numeric
+        cls.Numeric = Numeric
 
-        @dbm.model('unittests', 'strings')
+        @dbm.model('unittests', 'strings', slots=True)
         @dataclass
         class String:
             type: NotNull[EnumType[EnumExample]] = NO_DEFAULT
@@ -43,9 +47,9 @@ class TestDatatypes(ConnectionUnitTest):
             varchar: NotNull[VARCHAR[16]] = NO_DEFAULT
             char: NotNull[CHAR[16]] = NO_DEFAULT
 
-        self.String = String
+        cls.String = String
 
-        @dbm.model('unittests', 'times')
+        @dbm.model('unittests', 'times', slots=True)
         @dataclass
         class Time:
             timestamp: NotNull[TIMESTAMP] = NO_DEFAULT
@@ -53,19 +57,23 @@ class TestDatatypes(ConnectionUnitTest):
             date: NotNull[DATE] = NO_DEFAULT
             time: NotNull[TIME] = NO_DEFAULT
 
-        self.Time = Time
+        cls.Time = Time
 
-        @dbm.model('unittests', 'miscs')
+        @dbm.model('unittests', 'miscs', slots=True)
         @dataclass
         class Misc:
             boolean: NotNull[BOOL] = NO_DEFAULT
 
-        self.Misc = Misc
+        cls.Misc = Misc
 
-        Numeric.createTable(self.conn, recreateTable=True)
-        String.createTable(self.conn, recreateTable=True, recreateColumns=True)
-        Time.createTable(self.conn, recreateTable=True)
-        Misc.createTable(self.conn, recreateTable=True)
+        Numeric.createTable(cls.conn, recreateTable=True)
+        String.createTable(cls.conn, recreateTable=True, recreateColumns=True)
+        Time.createTable(cls.conn, recreateTable=True)
+        Misc.createTable(cls.conn, recreateTable=True)
+
+        cls.models = (Numeric, String, Time, Misc)
+
+        cls.conn.commit()
 
     def test_numerics(self) -> None:
         n0 = self.Numeric(1, 1.5, 123.456, 789.012)
@@ -101,6 +109,20 @@ class TestDatatypes(ConnectionUnitTest):
 
         self.assertEqual(t0, t1)
 
+        # Compared with the value given rather than t0, which insert fills back in with the loaded values
+        self.assertEqual(t1.timestamp, timestamp.replace(tzinfo=dt.timezone.utc))
+        self.assertEqual(t1.timestamp.tzinfo, dt.timezone.utc)
+
+    def test_datetimeAsDate(self) -> None:
+        timestamp = dt.datetime(2003, 10, 21, 20, 8, 47)
+
+        # Sent as the whole timestamp like any other value with isoformat, postgres stores its date
+        self.assertEqual(DATE.convertInsertableFromData(self.conn, timestamp), timestamp.isoformat())
+
+        self.Time(timestamp, timestamp, timestamp, timestamp.time()).insert(self.conn)
+
+        self.assertEqual(self.Time.instantiateOne(self.conn).date, timestamp.date())
+
     def test_miscs(self) -> None:
         m0 = self.Misc(False)
 
@@ -111,20 +133,91 @@ class TestDatatypes(ConnectionUnitTest):
         self.assertEqual(m0, m1)
 
 
+class TestEnumConversion(unittest.TestCase):
+    def test_intEnum(self) -> None:
+        class Level(IntEnum):
+            LOW = 1
+            HIGH = 2
+
+        levels = EnumType[Level]
+
+        self.assertEqual(levels.convertInsertableFromData(None, Level.HIGH), 'high')
+        self.assertEqual(levels.convertInsertablesFromData(None, [Level.LOW, None, 'high']), ['low', None, 'high'])
+
+        # Plain ints equal to a member's value are not members
+        with self.assertRaises(EnumValueError):
+            levels.convertInsertableFromData(None, 2)
+
+        with self.assertRaises(EnumValueError):
+            levels.convertInsertablesFromData(None, [Level.LOW, 1])
+
+
+class TestSubscriptionCache(unittest.TestCase):
+    def test_foreignKeyCollected(self) -> None:
+        @dbm.model('unittests', 'owners')
+        @dataclass
+        class Owner:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+
+        self.assertIs(NotNull[ForeignKey[Owner]], NotNull[ForeignKey[Owner]])
+        self.assertIs(Array[ForeignKey[Owner, 'id']], Array[ForeignKey[Owner, 'id']])
+
+        owner = weakref.ref(Owner)
+        del Owner
+        gc.collect()
+
+        self.assertIsNone(owner())
+
+    def test_referencingModelCollected(self) -> None:
+        @dbm.model('unittests', 'owners')
+        @dataclass
+        class Owner:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+
+        @dbm.model('unittests', 'pets')
+        @dataclass
+        class Pet:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+            owner: NotNull[ForeignKey[Owner]] = NO_DEFAULT
+
+        owner = weakref.ref(Owner)
+        del Owner, Pet
+        # The first collection frees Pet, its columns and their cache entries, which frees Owner on the second
+        gc.collect()
+        gc.collect()
+
+        self.assertIsNone(owner())
+
+    def test_enumCollected(self) -> None:
+        class Mood(Enum):
+            HAPPY = auto()
+            SAD = auto()
+
+        self.assertIs(EnumType[Mood], EnumType[Mood])
+        self.assertIs(Composite['moods', (('mood', EnumType[Mood]),)], Composite['moods', (('mood', EnumType[Mood]),)])
+
+        mood = weakref.ref(Mood)
+        del Mood
+        gc.collect()
+
+        self.assertIsNone(mood())
+
+
 class TestArrays(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-        @dbm.model('unittests', 'numericarrays')
+        @dbm.model('unittests', 'numericarrays', slots=True)
         @dataclass
         class Numeric:
             integer: NotNull[Array[INTEGER]] = NO_DEFAULT
             real: NotNull[Array[REAL]] = NO_DEFAULT
             numeric: NotNull[Array[NUMERIC[6, 3]]] = NO_DEFAULT
 
-        self.Numeric = Numeric
+        cls.Numeric = Numeric
 
-        @dbm.model('unittests', 'stringarrays')
+        @dbm.model('unittests', 'stringarrays', slots=True)
         @dataclass
         class String:
             type: NotNull[Array[EnumType[EnumExample]]] = NO_DEFAULT
@@ -132,9 +225,9 @@ class TestArrays(ConnectionUnitTest):
             varchar: NotNull[Array[VARCHAR[16]]] = NO_DEFAULT
             char: NotNull[Array[CHAR[16]]] = NO_DEFAULT
 
-        self.String = String
+        cls.String = String
 
-        @dbm.model('unittests', 'timearrays')
+        @dbm.model('unittests', 'timearrays', slots=True)
         @dataclass
         class Time:
             timestamp: NotNull[Array[TIMESTAMP]] = NO_DEFAULT
@@ -142,19 +235,23 @@ class TestArrays(ConnectionUnitTest):
             date: NotNull[Array[DATE]] = NO_DEFAULT
             time: NotNull[Array[TIME]] = NO_DEFAULT
 
-        self.Time = Time
+        cls.Time = Time
 
-        @dbm.model('unittests', 'miscarrays')
+        @dbm.model('unittests', 'miscarrays', slots=True)
         @dataclass
         class Misc:
             boolean: NotNull[Array[BOOL]] = NO_DEFAULT
 
-        self.Misc = Misc
+        cls.Misc = Misc
 
-        Numeric.createTable(self.conn, recreateTable=True)
-        String.createTable(self.conn, recreateTable=True)
-        Time.createTable(self.conn, recreateTable=True)
-        Misc.createTable(self.conn, recreateTable=True)
+        Numeric.createTable(cls.conn, recreateTable=True)
+        String.createTable(cls.conn, recreateTable=True)
+        Time.createTable(cls.conn, recreateTable=True)
+        Misc.createTable(cls.conn, recreateTable=True)
+
+        cls.models = (Numeric, String, Time, Misc)
+
+        cls.conn.commit()
 
     def test_numericarrays(self) -> None:
         n0 = self.Numeric([1, 2], [1.5, 3.25], [123.456, 789.012])
@@ -189,6 +286,7 @@ class TestArrays(ConnectionUnitTest):
         t1 = self.Time.instantiateOne(self.conn)
 
         self.assertEqual(t0, t1)
+        self.assertEqual(t1.timestamp, [timestamp.replace(tzinfo=dt.timezone.utc)])
 
     def test_miscarrays(self) -> None:
         m0 = self.Misc([False, True, True])
@@ -210,10 +308,11 @@ class TestArrays(ConnectionUnitTest):
 
 
 class TestMultiArrays(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-        @dbm.model('unittests', 'multiarray')
+        @dbm.model('unittests', 'multiarray', slots=True)
         @dataclass
         class MultiArray:
             none: INTEGER = NO_DEFAULT
@@ -223,9 +322,13 @@ class TestMultiArrays(ConnectionUnitTest):
             four: Array[Array[Array[Array[INTEGER]]]] = NO_DEFAULT
             five: Array[Array[Array[Array[Array[INTEGER]]]]] = NO_DEFAULT
 
-        MultiArray.createTable(self.conn, recreateTable=True)
+        MultiArray.createTable(cls.conn, recreateTable=True)
+
+        cls.MultiArray = MultiArray
 
-        self.MultiArray = MultiArray
+        cls.models = (MultiArray,)
+
+        cls.conn.commit()
 
     def test_multiArrays(self) -> None:
         multi = self.MultiArray(
@@ -243,29 +346,43 @@ class TestMultiArrays(ConnectionUnitTest):
 
         self.assertEqual(multi, other)
 
+    def test_multiArraysCopy(self) -> None:
+        multis = [
+            self.MultiArray(i, [i, 2], [[i, 3], [4, 5]], [[[i]]], [[[[i, 6]]]], [[[[[i], [7]]]]]) for i in range(100)
+        ]
+
+        self.MultiArray.copyMany(self.conn, multis)
+
+        self.assertEqual(list(self.MultiArray.instantiateAll(self.conn, 'ORDER BY "none"')), multis)
+
 
 class TestComposites(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-        @dbm.model('unittests', 'compositeforeign')
+        @dbm.model('unittests', 'compositeforeign', slots=True)
         @dataclass
         class CompositeForeign:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
             boolean: NotNull[BOOL] = NO_DEFAULT
 
-        @dbm.model('unittests', 'multiarray')
+        @dbm.model('unittests', 'multiarray', slots=True)
         @dataclass
         class CompositeTypes:
             complexNumber: Composite['complex', (('r', REAL), ('i', REAL))] = NO_DEFAULT
             arrayOfComplex: Array[Composite['complex', (('r', REAL), ('i', REAL))]] = NO_DEFAULT
             foreign: Composite['example', (('f', FalseForeignKey[CompositeForeign]), ('x', REAL))] = NO_DEFAULT
 
-        self.CompositeTypes = CompositeTypes
-        self.CompositeForeign = CompositeForeign
+        cls.CompositeTypes = CompositeTypes
+        cls.CompositeForeign = CompositeForeign
+
+        CompositeForeign.createTable(cls.conn, recreateTable=True)
+        CompositeTypes.createTable(cls.conn, recreateTable=True, recreateColumns=True)
 
-        CompositeForeign.createTable(self.conn, recreateTable=True)
-        CompositeTypes.createTable(self.conn, recreateTable=True, recreateColumns=True)
+        cls.models = (CompositeForeign, CompositeTypes)
+
+        cls.conn.commit()
 
     def test_composites(self) -> None:
         cf = self.CompositeForeign(False)
@@ -279,24 +396,34 @@ class TestComposites(ConnectionUnitTest):
         self.assertEqual(c0, c1)
         self.assertNotEqual(c0, self.CompositeTypes((2.0, 3.0), [(1.0, 2.0), (3.0, 4.0)], (cf, 1.0)))
 
+    def test_compositesMany(self) -> None:
+        cf = self.CompositeForeign(False)
+
+        cs = [self.CompositeTypes((float(i), 2.0), [(1.0, 2.0), (3.0, float(i))], (cf, 1.0)) for i in range(100)]
+
+        self.CompositeTypes.insertMany(self.conn, cs)
+
+        self.assertCountEqual(self.CompositeTypes.instantiateAll(self.conn), cs)
+
 
 class TestForeignKeys(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-        @dbm.model('unittests', 'A')
+        @dbm.model('unittests', 'A', slots=True)
         @dataclass
         class A:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
             a: INTEGER = NO_DEFAULT
 
-        @dbm.model('unittests', 'B')
+        @dbm.model('unittests', 'B', slots=True)
         @dataclass
         class B:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
             b: INTEGER = NO_DEFAULT
 
-        @dbm.model('unittests', 'C')
+        @dbm.model('unittests', 'C', slots=True)
         @dataclass
         class C:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
@@ -304,13 +431,17 @@ class TestForeignKeys(ConnectionUnitTest):
             b: FalseForeignKey[B] = NO_DEFAULT
             bs: Array[FalseForeignKey[B]] = NO_DEFAULT
 
-        self.A = A
-        self.B = B
-        self.C = C
+        cls.A = A
+        cls.B = B
+        cls.C = C
+
+        A.createTable(cls.conn, recreateTable=True)
+        B.createTable(cls.conn, recreateTable=True)
+        C.createTable(cls.conn, recreateTable=True)
+
+        cls.models = (A, B, C)
 
-        A.createTable(self.conn, recreateTable=True)
-        B.createTable(self.conn, recreateTable=True)
-        C.createTable(self.conn, recreateTable=True)
+        cls.conn.commit()
 
     def test_foreignKey(self) -> None:
         a, b0, b1 = self.A(1), self.B(2), self.B(3)
@@ -322,6 +453,14 @@ class TestForeignKeys(ConnectionUnitTest):
 
         self.assertEqual(c0, c1)
 
+    def test_foreignKeyMany(self) -> None:
+        bs = self.B.insertMany(self.conn, [self.B(i) for i in range(10)])
+        cs = [self.C(self.A(i), bs[i], bs[:i]) for i in range(10)]
+
+        self.C.insertMany(self.conn, cs)
+
+        self.assertEqual(list(self.C.instantiateAll(self.conn, 'ORDER BY id')), cs)
+
     def test_noneForeignKey(self) -> None:
         c0 = self.C(None, None, [None, None])
 
@@ -0,0 +1,30 @@
+import unittest
+
+from src.databasemodels.helper import splitNestedString
+
+
+class TestSplitNestedString(unittest.TestCase):
+    def test_null(self):
+        self.assertEqual(splitNestedString(None), [])
+        self.assertEqual(splitNestedString('{}'), [])
+
+    def test_plain(self):
+        self.assertEqual(splitNestedString('{1,2,3}'), ['1', '2', '3'])
+        self.assertEqual(splitNestedString('{a,NULL,c}'), ['a', 'NULL', 'c'])
+
+    def test_quoted(self):
+        self.assertEqual(splitNestedString('{"a,b",c}'), ['a,b', 'c'])
+        self.assertEqual(splitNestedString('{"a\\"b","c\\\\d"}'), ['a"b', 'c\\d'])
+        self.assertEqual(splitNestedString('{"{x}","line\nbreak"}'), ['{x}', 'line\nbreak'])
+
+    def test_nested(self):
+        self.assertEqual(splitNestedString('{{1,2},{3,4}}'), ['{1,2}', '{3,4}'])
+        self.assertEqual(splitNestedString('{"(1,2)","(3,\\"x,y\\")"}'), ['(1,2)', '(3,"x,y")'])
+
+    def test_composite(self):
+        self.assertEqual(splitNestedString('(1,"a""b")'), ['1', 'a"b'])
+        self.assertEqual(splitNestedString('(1,)'), ['1', ''])
+
+
+if __name__ == '__main__':
+    unittest.main()
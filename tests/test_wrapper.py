@@ -21,8 +21,9 @@ class Color(Enum):
 
 
 class TestDecorator(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
         @dbm.model('unittests', 'fruits', useInstanceCache=False)
         @dataclass
@@ -32,9 +33,13 @@ class TestDecorator(ConnectionUnitTest):
             weight: REAL = NO_DEFAULT
             color: EnumType[Color] = NO_DEFAULT
 
-        self.Fruit = Fruit
+        cls.Fruit = Fruit
 
-        Fruit.createTable(self.conn, recreateTable=True)
+        Fruit.createTable(cls.conn, recreateTable=True)
+
+        cls.models = (Fruit,)
+
+        cls.conn.commit()
 
     def test_creation(self) -> None:
         pear = self.Fruit('Pear', 3, 'yellow')
@@ -85,9 +90,81 @@ class TestDecorator(ConnectionUnitTest):
         self.assertTrue(apple.delete(self.conn))
         self.assertFalse(apple.delete(self.conn))
 
+    def test_insertMany(self) -> None:
+        fruits = self.Fruit.insertMany(self.conn, [self.Fruit('Apple', 3, 'red'), self.Fruit('Kiwi', 1, 'green')])
+
+        self.assertTrue(all(f.id is not None for f in fruits))
+        self.assertEqual(list(self.Fruit.instantiateAll(self.conn, 'ORDER BY id')), fruits)
+
+    def test_insertOrUpdate(self) -> None:
+        apple, kiwi = self.Fruit('Apple', 3, 'red'), self.Fruit('Kiwi', 1, 'green')
+
+        apple.insertOrUpdate(self.conn)
+        apple.weight = 4
+
+        self.Fruit.insertOrUpdateMany(self.conn, [apple, kiwi])
+
+        self.assertIsNotNone(kiwi.id)
+        self.assertEqual(self.Fruit.instantiateFromPrimaryKey(self.conn, apple.id).weight, 4)
+        self.assertEqual(len(self.Fruit.instantiateAll(self.conn)), 2)
+
+    def test_insertOrUpdateAfterTruncate(self) -> None:
+        apple = self.Fruit('Apple', 3, 'red')
+
+        apple.insert(self.conn)
+        apple.delete(self.conn)
+
+        # Restarts the id sequence, re-inserting apple must take its id from the sequence rather than reuse the old one
+        self.Fruit.truncate(self.conn)
+
+        apple.insertOrUpdate(self.conn)
+        kiwi = self.Fruit('Kiwi', 1, 'green').insert(self.conn)
+
+        self.assertNotEqual(apple.id, kiwi.id)
+        self.assertEqual(len(self.Fruit.instantiateAll(self.conn)), 2)
+
+    def test_upsert(self) -> None:
+        @dbm.model('unittests', 'labels')
+        @dataclass
+        class Label:
+            id: PrimaryKey[INTEGER] = NO_DEFAULT
+            name: TEXT = NO_DEFAULT
+
+        Label.createTable(self.conn, recreateTable=True)
+
+        label = Label(7, 'seven')
+        label.insertOrUpdate(self.conn)
+        label.name = 'SEVEN'
+        label.insertOrUpdate(self.conn)
+
+        self.assertIsNotNone(Label.__upsert_statement__)
+        self.assertEqual(Label.instantiateAll(self.conn), (Label(7, 'SEVEN'),))
+
+    def test_preparedStatements(self) -> None:
+        @dbm.model('unittests', 'tags')
+        @dataclass
+        class Tag:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+            name: TEXT = NO_DEFAULT
+
+        Tag.createTable(self.conn, recreateTable=True)
+
+        tag = Tag('first').insert(self.conn)
+        tag.delete(self.conn)
+
+        # Prepared from their first execution even though the connection's threshold is higher
+        with self.conn.cursor() as cur:
+            cur.execute('SELECT statement FROM pg_prepared_statements WHERE statement LIKE %s;', ('%"tags"%',))
+
+            statements = [s.split()[0] for s, in cur]
+
+        self.assertIn('INSERT', statements)
+        self.assertIn('DELETE', statements)
+
 
 class TestGetters(unittest.TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         @dbm.model('unittests', 'fruits')
         @dataclass
         class Fruit:
@@ -96,8 +173,8 @@ class TestGetters(unittest.TestCase):
             weight: REAL = NO_DEFAULT
             color: EnumType[Color] = NO_DEFAULT
 
-        self.pear = Fruit('Pear', 3, 'yellow')
-        self.Fruit = Fruit
+        cls.pear = Fruit('Pear', 3, 'yellow')
+        cls.Fruit = Fruit
 
     def test_getColumn(self) -> None:
         self.assertIsInstance(self.pear.getColumn('id'), dbm.Column)
@@ -120,10 +197,64 @@ class TestGetters(unittest.TestCase):
         self.assertEqual(self.pear.table, 'fruits')
         self.assertEqual(self.Fruit.table, 'fruits')
 
+    def test_decoratedTwice(self) -> None:
+        @dataclass
+        class Vegetable:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+            name: TEXT = NO_DEFAULT
+
+        self.assertIs(dbm.model('unittests', 'vegetables')(Vegetable), dbm.model('unittests', 'vegetables')(Vegetable))
+        self.assertIsNot(dbm.model('unittests', 'vegetables')(Vegetable), dbm.model('unittests', 'greens')(Vegetable))
+
+
+class TestStringAnnotations(unittest.TestCase):
+    def test_stringAnnotations(self) -> None:
+        @dbm.model('unittests', 'fruits')
+        @dataclass
+        class Fruit:
+            id: 'PrimaryKey[SERIAL]' = AUTO_FILLED
+            name: 'NotNull[TEXT]' = NO_DEFAULT
+            color: 'EnumType[Color]' = NO_DEFAULT
+
+        self.assertIsInstance(Fruit.getColumn('name').type, NotNull)
+        self.assertEqual(Fruit.getColumn('id'), Fruit.primaryKeyColumn)
+        self.assertEqual(Fruit.getColumn('color').type.enumType, Color)
+
+
+class TestSlots(unittest.TestCase):
+    def test_slots(self) -> None:
+        @dbm.model('unittests', 'fruits', slots=True)
+        @dataclass
+        class Fruit:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+            name: TEXT = NO_DEFAULT
+            weight: REAL = NO_DEFAULT
+
+        pear = Fruit('Pear', 3)
+
+        self.assertFalse(hasattr(pear, '__dict__'))
+        self.assertIsNone(pear.id)
+        self.assertEqual(pear.name, 'Pear')
+        self.assertEqual(pear, Fruit('Pear', 3))
+        self.assertEqual(str(pear), 'unittests.fruits(id=None, name=Pear, weight=3)')
+        self.assertIn('weight', dir(pear))
+
+        @dbm.model('unittests', 'bigfruits', slots=True)
+        @dataclass
+        class BigFruit(Fruit):
+            size: INTEGER = NO_DEFAULT
+
+        melon = BigFruit('Melon', 5, 10)
+
+        self.assertFalse(hasattr(melon, '__dict__'))
+        self.assertEqual(melon.size, 10)
+        self.assertEqual(BigFruit.__slots__, ('size',))
+
 
 class TestCreation(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
         @dbm.model('unittests', 'fruits')
         @dataclass
@@ -140,22 +271,93 @@ class TestCreation(ConnectionUnitTest):
             fruit: ForeignKey[Fruit] = NO_DEFAULT
             quantity: INTEGER = NO_DEFAULT
 
-        self.Fruit = Fruit
-        self.FruitBasket = FruitBasket
+        cls.Fruit = Fruit
+        cls.FruitBasket = FruitBasket
+
+        Fruit.createTable(cls.conn, recreateTable=True)
+        FruitBasket.createTable(cls.conn, recreateTable=True)
+
+        cls.models = (Fruit, FruitBasket)
 
-        Fruit.createTable(self.conn, recreateTable=True)
-        FruitBasket.createTable(self.conn, recreateTable=True)
+        cls.conn.commit()
 
     def test_createTable(self) -> None:
         self.Fruit.createTable(self.conn, recreateTable=True)
         self.FruitBasket.createTable(self.conn, recreateTable=True)
 
+    def test_createTableRecreate(self) -> None:
+        for recreateSchema in (False, True):
+            for recreateTable in (False, True):
+                self.Fruit.createTable(self.conn, recreateSchema=recreateSchema, recreateTable=recreateTable)
+                self.FruitBasket.createTable(self.conn, recreateTable=recreateTable)
+
+                basket = self.FruitBasket(self.Fruit('Pear', 3, Color.YELLOW), 2)
+                basket.insert(self.conn)
+
+                self.assertEqual(self.FruitBasket.instantiateFromPrimaryKey(self.conn, basket.id), basket)
+
+    def test_createTableAfterRollback(self) -> None:
+        class Shade(Enum):
+            LIGHT = 'light'
+            DARK = 'dark'
+
+        @dbm.model('unittests', 'shades')
+        @dataclass
+        class Paint:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+            shade: EnumType[Shade] = NO_DEFAULT
+
+        # The type created here is rolled back along with the table, so it has to be created again
+        Paint.createTable(self.conn, recreateTable=True)
+        self.conn.rollback()
+        Paint.createTable(self.conn, recreateTable=True)
+
+        paint = Paint(Shade.DARK)
+        paint.insert(self.conn)
+
+        self.assertEqual(Paint.instantiateOne(self.conn), paint)
+
+    def test_createTableAutocommit(self) -> None:
+        class Tint(Enum):
+            WARM = 'warm'
+            COOL = 'cool'
+
+        @dbm.model('unittests', 'tints')
+        @dataclass
+        class Swatch:
+            id: PrimaryKey[SERIAL] = AUTO_FILLED
+            tint: EnumType[Tint] = NO_DEFAULT
+
+        # Types created inside a transaction are not remembered, a rollback would undo them
+        Swatch.createTable(self.conn, recreateTable=True)
+        self.assertNotIn(EnumType[Tint], dbm.wrapper.initializedTypes.get(self.conn, set()))
+        self.conn.commit()
+
+        self.conn.autocommit = True
+
+        try:
+            Swatch.createTable(self.conn, recreateTable=True)
+            self.assertIn(EnumType[Tint], dbm.wrapper.initializedTypes[self.conn])
+
+            Swatch.createTable(self.conn, recreateTable=True)
+
+            swatch = Swatch(Tint.COOL)
+            swatch.insert(self.conn)
+
+            self.assertEqual(Swatch.instantiateOne(self.conn), swatch)
+        finally:
+            with self.conn.cursor() as cur:
+                cur.execute('DROP TABLE unittests.tints;')
+
+            self.conn.autocommit = False
+
 
 class TestInstantiation(ConnectionUnitTest):
-    def setUp(self) -> None:
-        super().setUp()
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
 
-        @dbm.model('unittests', 'products')
+        @dbm.model('unittests', 'products', slots=True)
         @dataclass
         class Product:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
@@ -163,7 +365,7 @@ class TestInstantiation(ConnectionUnitTest):
             weight: REAL = NO_DEFAULT
             color: EnumType[Color] = NO_DEFAULT
 
-        @dbm.model('unittests', 'users')
+        @dbm.model('unittests', 'users', slots=True)
         @dataclass
         class User:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
@@ -171,7 +373,7 @@ class TestInstantiation(ConnectionUnitTest):
             name: TEXT = NO_DEFAULT
             address: TEXT = NO_DEFAULT
 
-        @dbm.model('unittests', 'orders')
+        @dbm.model('unittests', 'orders', slots=True)
         @dataclass
         class Order:
             id: PrimaryKey[SERIAL] = AUTO_FILLED
@@ -179,13 +381,17 @@ class TestInstantiation(ConnectionUnitTest):
             user: ForeignKey[User, 'id'] = NO_DEFAULT
             quantity: INTEGER = NO_DEFAULT
 
-        self.Product = Product
-        self.User = User
-        self.Order = Order
+        cls.Product = Product
+        cls.User = User
+        cls.Order = Order
+
+        Product.createTable(cls.conn, recreateTable=True)
+        User.createTable(cls.conn, recreateTable=True)
+        Order.createTable(cls.conn, recreateTable=True)
+
+        cls.models = (Product, User, Order)
 
-        Product.createTable(self.conn, recreateTable=True)
-        User.createTable(self.conn, recreateTable=True)
-        Order.createTable(self.conn, recreateTable=True)
+        cls.conn.commit()
 
     def test_creationAndRetrieval(self) -> None:
         order = self.Order(
@@ -210,6 +416,27 @@ class TestInstantiation(ConnectionUnitTest):
 
         self.assertEqual(self.Order.instantiateAll(self.conn)[0], order)
 
+    def test_serverSideInstantiation(self) -> None:
+        products = self.Product.insertMany(self.conn, [self.Product(str(i), i, Color.BLUE) for i in range(10)])
+
+        self.assertEqual(list(self.Product.instantiate(self.conn, 'ORDER BY id', serverSide=True)), products)
+
+    def test_serverSideInstantiationAutocommit(self) -> None:
+        orders = self.Order.insertMany(self.conn, [
+            self.Order(self.Product(str(i), i, Color.RED), self.User(self.Product('Hammer', 2.3, Color.YELLOW),
+                                                                     'Hazel', 'localhost'), i)
+            for i in range(10)
+        ])
+
+        self.conn.commit()
+        self.conn.autocommit = True
+
+        try:
+            # Foreign keys are loaded on the same connection while the cursor is open
+            self.assertEqual(list(self.Order.instantiate(self.conn, 'ORDER BY id', serverSide=True)), orders)
+        finally:
+            self.conn.autocommit = False
+
 
 if __name__ == '__main__':
     unittest.main()